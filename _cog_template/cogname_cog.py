@@ -1,9 +1,10 @@
 import logging
-import os
 
 from discord import app_commands
 from redbot.core import commands
 
+from utilities.config_utils import guild_id_from_env
+
 from .config import ConfigManager
 
 logger = logging.getLogger(__name__)
@@ -15,7 +16,7 @@ class NameOfCog(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.guild_id = int(os.getenv("GUILD_ID"))
+        self.guild_id = guild_id_from_env()
         self.config_manager = ConfigManager(self.guild_id, self)
 
     def cog_unload(self):
@@ -1,18 +1,28 @@
+import functools
 import hashlib
-import os
 
 from redbot.core import Config
 
+from utilities.config_utils import guild_id_from_env
+
+
+@functools.cache
+def _identifier_for(cog_name: str) -> int:
+    """Config identifier derived from the cog's class name, computed once per name."""
+    # Same value as int(hexdigest, 16) % 10**10, so existing Config data stays reachable.
+    return int.from_bytes(hashlib.sha256(cog_name.encode()).digest(), "big") % 10**10
+
+
+def _parse_coords(coord_str: str) -> tuple[float, float]:
+    """Split a stored "lat,lon" string into floats."""
+    lat, _, lon = coord_str.partition(",")
+    return float(lat), float(lon)
+
 
 class ConfigManager:
     def __init__(self, guild_id, cog_instance):
-        cog_name = cog_instance.__class__.__name__
-        identifier = int(hashlib.sha256(cog_name.encode()).hexdigest(), 16) % 10**10
-        get_guild_id_from_env = int(os.getenv("GUILD_ID", None))
-        set_guild_id = guild_id or get_guild_id_from_env
-        if set_guild_id is None:
-            error_no_guild_id = "No GUILD_ID passed or set from .env file."
-            raise ValueError(error_no_guild_id)
+        identifier = _identifier_for(cog_instance.__class__.__name__)
+        guild_id = guild_id or guild_id_from_env()
 
         self.config = Config.get_conf(cog_instance, identifier=identifier, force_registration=True)
         default_guild = {
@@ -25,6 +35,4 @@ class ConfigManager:
 
     async def get_NAME_OF_DATAs(self, guild_id: int):
         locations = await self.config.guild_from_id(guild_id).NAME_OF_DATAs()
-        for city, (api_type, coord_str) in locations.items():
-            locations[city] = (api_type, tuple(map(float, coord_str.split(","))))
-        return locations
+        return {city: (api_type, _parse_coords(coord_str)) for city, (api_type, coord_str) in locations.items()}
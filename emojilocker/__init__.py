@@ -1,15 +1,12 @@
-import json
-from pathlib import Path
-
 from redbot.core.bot import Red
 
+from utilities.config_utils import lazy_end_user_data_statement
+
 from .emojilocker_cog import EmojiLocker
 
-with Path.open(Path(__file__).parent / "info.json") as fp:
-    __red_end_user_data_statement__ = json.load(fp)["end_user_data_statement"]
+__getattr__ = lazy_end_user_data_statement(__file__)
 
 
 async def setup(bot: Red) -> None:
     emoji_locker_cog = EmojiLocker(bot)
     await bot.add_cog(emoji_locker_cog)
-    await bot.tree.sync()
@@ -1,21 +1,40 @@
 import asyncio
 import logging
+import random
+import time
+from itertools import islice
 
 import discord
 from discord.http import HTTPException
 from discord.ui import Select, View
 from redbot.core import Config, commands
 
-from utilities.discord_utils import PaginatorView
+from utilities.discord_utils import LazyPaginatorView
 from utilities.image_utils import get_image_handler
 
 logger = logging.getLogger(__name__)
+EMOJI_EDIT_CONCURRENCY = 5  # Emoji edits share one rate-limit bucket per guild, so keep the fan-out small
+MAX_RETRY_DELAY_SECONDS = 30.0
+ADMIN_ROLES_TTL_SECONDS = 30.0
+MAX_SELECT_OPTIONS = 25  # Discord rejects select menus with more options than this
+ROLE_WORKER_COUNT = 3  # Reaction role changes drained concurrently, so bursts queue up instead of racing into 429s
+
+
+def _format_restricted_emoji_page(emojis) -> str:
+    return "".join(f"{emoji}: {', '.join(role.name for role in emoji.roles)}\n" for emoji in emojis)
 
 
 class EmojiRoleSelect(Select):
-    def __init__(self, emojis, roles):
-        options = [discord.SelectOption(label=str(emoji), value=str(emoji.id)) for emoji in emojis if emoji is not None]
-        super().__init__(placeholder="Select an emoji", min_values=1, max_values=1, options=options)
+    def __init__(self, cog, emojis, roles):
+        emojis = [emoji for emoji in emojis if emoji is not None]
+        options = [
+            discord.SelectOption(label=str(emoji), value=str(emoji.id)) for emoji in islice(emojis, MAX_SELECT_OPTIONS)
+        ]
+        placeholder = "Select an emoji"
+        if len(emojis) > MAX_SELECT_OPTIONS:
+            placeholder += f" (first {MAX_SELECT_OPTIONS} of {len(emojis)} shown)"
+        super().__init__(placeholder=placeholder, min_values=1, max_values=1, options=options)
+        self.cog = cog
         self.roles = roles
 
     async def callback(self, interaction: discord.Interaction):
@@ -28,7 +47,11 @@ class EmojiRoleSelect(Select):
         role_select = RoleSelect(self.roles, self.cog, emoji)
         view = View()
         view.add_item(role_select)
-        await interaction.response.send_message("Select a role to assign to the emoji:", view=view, ephemeral=True)
+        prompt = "Select a role to assign to the emoji:"
+        omitted_roles = len(self.roles) - MAX_SELECT_OPTIONS
+        if omitted_roles > 0:
+            prompt += f"\n-# Only the first {MAX_SELECT_OPTIONS} roles fit; {omitted_roles} more aren't listed."
+        await interaction.response.send_message(prompt, view=view, ephemeral=True)
 
 
 class ViewWithCog(View):
@@ -39,7 +62,9 @@ class ViewWithCog(View):
 
 class RoleSelect(discord.ui.Select):
     def __init__(self, roles, cog, emoji):
-        options = [discord.SelectOption(label=role.name, value=str(role.id)) for role in roles]
+        options = [
+            discord.SelectOption(label=role.name, value=str(role.id)) for role in islice(roles, MAX_SELECT_OPTIONS)
+        ]
         super().__init__(
             placeholder="Choose a role", min_values=1, max_values=1, options=options, custom_id="role_select"
         )
@@ -47,66 +72,76 @@ class RoleSelect(discord.ui.Select):
         self.emoji = emoji
 
     async def callback(self, interaction: discord.Interaction):
+        # Editing the emoji can outlast the three second response window, so acknowledge first
+        await interaction.response.defer(ephemeral=True)
         role_id = int(self.values[0])
         role = interaction.guild.get_role(role_id)
         if not role:
-            await interaction.response.send_message("Role not found.", ephemeral=True)
+            await interaction.followup.send("Role not found.", ephemeral=True)
             return
 
         # Get the admin roles
-        admin_roles = await self.bot.get_admin_roles(interaction.guild)
+        admin_roles = await self.cog.get_admin_roles(interaction.guild)
 
         try:
             # Add the selected role and the admin roles to the emoji
-            await self.emoji.edit(roles=[role, admin_roles], reason="Restricting emoji to specific role")
-            await interaction.response.send_message(
+            await self.emoji.edit(roles=[role, *admin_roles], reason="Restricting emoji to specific role")
+
+            # Only record the restriction once Discord has accepted the edit
+            await self.cog.record_restriction(interaction.guild, self.emoji, role, admin_roles)
+
+            await interaction.followup.send(
                 f"Emoji {self.emoji} is now restricted to role {role.name} and admin roles", ephemeral=True
             )
         except discord.Forbidden:
-            await interaction.response.send_message("I do not have permission to edit this emoji.", ephemeral=True)
+            await interaction.followup.send("I do not have permission to edit this emoji.", ephemeral=True)
         except discord.HTTPException as e:
-            await interaction.response.send_message(f"Failed to edit emoji: {e}", ephemeral=True)
-
-            async with self.cog.config.guild(interaction.guild).emoji_roles() as emoji_roles:
-                emoji_roles[str(self.emoji.id)] = {"role_id": role.id, "roles": [role.id for role in admin_roles]}
+            await interaction.followup.send(f"Failed to edit emoji: {e}", ephemeral=True)
 
 
 class UnrestrictEmojiSelect(discord.ui.Select):
     def __init__(self, cog, restricted_emojis: list[discord.Emoji]):
-        options = [discord.SelectOption(label=str(emoji), value=str(emoji.id)) for emoji in restricted_emojis]
-        super().__init__(placeholder="Select an emoji to unrestrict", min_values=1, max_values=1, options=options)
+        options = [
+            discord.SelectOption(label=str(emoji), value=str(emoji.id))
+            for emoji in islice(restricted_emojis, MAX_SELECT_OPTIONS)
+        ]
+        super().__init__(
+            placeholder="Select an emoji to unrestrict", min_values=1, max_values=1, options=options, row=0
+        )
         self.cog = cog
 
     async def callback(self, interaction: discord.Interaction):
+        # Editing the emoji can outlast the three second response window, so acknowledge first
+        await interaction.response.defer(ephemeral=True)
         try:
             emoji_id = int(self.values[0])
             emoji = interaction.guild.get_emoji(emoji_id)
             if not emoji:
-                await interaction.response.send_message("Emoji not found.", ephemeral=True)
+                await interaction.followup.send("Emoji not found.", ephemeral=True)
                 return
 
-            logger.debug(f"Unrestricting emoji: {emoji}")
+            logger.debug("Unrestricting emoji: %s", emoji)
 
             if not emoji.roles:  # Check if the emoji already has no roles assigned
-                await interaction.response.send_message(f"Emoji {emoji} is not restricted.", ephemeral=True)
+                await interaction.followup.send(f"Emoji {emoji} is not restricted.", ephemeral=True)
                 return
 
             await emoji.edit(roles=[], reason="Unrestricting emoji")
             logger.debug("Emoji unrestricted: %s", emoji)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Emoji {emoji} is now unrestricted and can be used by all roles.",
                 ephemeral=True,
             )
 
         except discord.Forbidden:
             logger.exception("Failed to unrestrict emoji due to insufficient permissions.")
-            await interaction.response.send_message("I do not have permission to edit this emoji.", ephemeral=True)
+            await interaction.followup.send("I do not have permission to edit this emoji.", ephemeral=True)
         except discord.HTTPException as e:
             logger.exception("Failed to unrestrict emoji due to an HTTP exception:")
-            await interaction.response.send_message(f"Failed to edit emoji: {e}", ephemeral=True)
+            await interaction.followup.send(f"Failed to edit emoji: {e}", ephemeral=True)
         except Exception:  # Catch more general exceptions for configuration saving
             logger.exception("An unexpected error occurred while unrestricting emoji:")
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "An error occurred while saving the configuration. Please try again later.",
                 ephemeral=True,
             )
@@ -115,7 +150,46 @@ class UnrestrictEmojiSelect(discord.ui.Select):
 class UnrestrictEmojiView(discord.ui.View):
     def __init__(self, cog, restricted_emojis):
         super().__init__()
-        self.add_item(UnrestrictEmojiSelect(cog, restricted_emojis))
+        self.cog = cog
+        # A select holds at most MAX_SELECT_OPTIONS emojis, so longer lists are paged through with buttons
+        self.pages = [
+            restricted_emojis[start : start + MAX_SELECT_OPTIONS]
+            for start in range(0, len(restricted_emojis), MAX_SELECT_OPTIONS)
+        ]
+        self.current_page = 0
+        self.emoji_select = UnrestrictEmojiSelect(cog, self.pages[0])
+        self.add_item(self.emoji_select)
+        if len(self.pages) > 1:
+            self.back_button = discord.ui.Button(emoji="⬅️", style=discord.ButtonStyle.primary, row=1)
+            self.page_button = discord.ui.Button(style=discord.ButtonStyle.secondary, disabled=True, row=1)
+            self.forward_button = discord.ui.Button(emoji="➡️", style=discord.ButtonStyle.primary, row=1)
+            self.back_button.callback = self.previous_button_callback
+            self.forward_button.callback = self.next_button_callback
+            self.add_item(self.back_button)
+            self.add_item(self.page_button)
+            self.add_item(self.forward_button)
+            self.update_buttons()
+
+    async def previous_button_callback(self, interaction: discord.Interaction):
+        if self.current_page > 0:
+            await self.show_page(interaction, self.current_page - 1)
+
+    async def next_button_callback(self, interaction: discord.Interaction):
+        if self.current_page < len(self.pages) - 1:
+            await self.show_page(interaction, self.current_page + 1)
+
+    async def show_page(self, interaction: discord.Interaction, page: int):
+        self.current_page = page
+        self.remove_item(self.emoji_select)
+        self.emoji_select = UnrestrictEmojiSelect(self.cog, self.pages[page])
+        self.add_item(self.emoji_select)
+        self.update_buttons()
+        await interaction.response.edit_message(view=self)
+
+    def update_buttons(self):
+        self.page_button.label = f"{self.current_page + 1} of {len(self.pages)}"
+        self.back_button.disabled = self.current_page == 0
+        self.forward_button.disabled = self.current_page == len(self.pages) - 1
 
     async def interaction_check(self, interaction: discord.Interaction):
         return interaction.user.guild_permissions.manage_roles
@@ -127,6 +201,85 @@ class EmojiLocker(commands.Cog):
         self.config = Config.get_conf(self, identifier=1234567890, force_registration=True)
         default_guild = {"emoji_roles": {}}
         self.config.register_guild(**default_guild)
+        # Each guild's emoji_roles, loaded with one Config read and dropped whenever it is written
+        self._emoji_roles_cache: dict[int, dict] = {}
+        # Ids of the emojis each guild has configured, so unrelated reactions are dropped before any await
+        self._tracked_emoji: dict[int, set[int]] = {}
+        # guild_id -> (fetched_at, admin roles); short-lived so a burst of selects shares one lookup
+        self._admin_roles_cache: dict[int, tuple[float, list[discord.Role]]] = {}
+        # (member, role, add) changes from the reaction listeners, applied by a fixed pool of workers
+        self._role_queue: asyncio.Queue[tuple[discord.Member, discord.Role, bool]] = asyncio.Queue()
+        self._role_workers: list[asyncio.Task] = []
+        # Each guild's role-restricted emojis, built on first use and rebuilt whenever the guild's emojis change
+        self._restricted_by_guild: dict[int, list[discord.Emoji]] = {}
+
+    async def cog_load(self):
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            self._tracked_emoji[guild_id] = {int(emoji_id) for emoji_id in guild_data["emoji_roles"]}
+        self._role_workers = [asyncio.create_task(self._role_worker()) for _ in range(ROLE_WORKER_COUNT)]
+
+    async def cog_unload(self):
+        for worker in self._role_workers:
+            worker.cancel()
+        dropped = self._role_queue.qsize()
+        if dropped:
+            logger.warning("Dropped %s queued reaction role changes on unload", dropped)
+
+    async def _role_worker(self):
+        while True:
+            member, role, add = await self._role_queue.get()
+            try:
+                if add:
+                    await member.add_roles(role)
+                else:
+                    await member.remove_roles(role)
+            except Exception:
+                # Log and keep draining; an unhandled error would end this worker for good
+                logger.exception("Failed to %s role %s for %s", "add" if add else "remove", role, member)
+            finally:
+                self._role_queue.task_done()
+
+    async def record_restriction(
+        self, guild: discord.Guild, emoji: discord.Emoji, role: discord.Role, admin_roles: list[discord.Role]
+    ):
+        """Store an emoji's role restriction and start tracking its reactions."""
+        async with self.config.guild(guild).emoji_roles() as emoji_roles:
+            emoji_roles[str(emoji.id)] = {
+                "role_id": role.id,
+                "roles": [admin_role.id for admin_role in admin_roles],
+            }
+        self._emoji_roles_cache.pop(guild.id, None)
+        self._tracked_emoji.setdefault(guild.id, set()).add(emoji.id)
+
+    def _is_tracked(self, reaction) -> bool:
+        guild = reaction.message.guild
+        # Unicode reactions arrive as plain strings with no id
+        emoji_id = getattr(reaction.emoji, "id", None)
+        return guild is not None and emoji_id in self._tracked_emoji.get(guild.id, ())
+
+    async def get_admin_roles(self, guild: discord.Guild) -> list[discord.Role]:
+        """Return the guild's admin roles, reusing a lookup made within the last ADMIN_ROLES_TTL_SECONDS."""
+        now = time.monotonic()
+        cached = self._admin_roles_cache.get(guild.id)
+        if cached is not None and now - cached[0] < ADMIN_ROLES_TTL_SECONDS:
+            return cached[1]
+        admin_roles = list(await self.bot.get_admin_roles(guild))
+        self._admin_roles_cache[guild.id] = (now, admin_roles)
+        return admin_roles
+
+    def _restricted_emojis(self, guild: discord.Guild) -> list[discord.Emoji]:
+        """Return the guild's emojis that are limited to specific roles, scanning guild.emojis only on a cache miss."""
+        restricted = self._restricted_by_guild.get(guild.id)
+        if restricted is None:
+            restricted = self._restricted_by_guild[guild.id] = [emoji for emoji in guild.emojis if emoji.roles]
+        return restricted
+
+    async def _get_emoji_roles(self, guild: discord.Guild) -> dict:
+        """Return the guild's emoji_roles, reading Config only on a cache miss. Treat the result as read-only."""
+        emoji_roles = self._emoji_roles_cache.get(guild.id)
+        if emoji_roles is None:
+            emoji_roles = self._emoji_roles_cache[guild.id] = await self.config.guild(guild).emoji_roles()
+        return emoji_roles
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -152,8 +305,8 @@ class EmojiLocker(commands.Cog):
             # Create the emoji
             await ctx.guild.create_custom_emoji(name=name, image=image_data)
             await ctx.send(f"Emoji :{name}: created successfully.")
-        except Exception as e:
-            logger.exception(f"An error occurred while creating emoji: {e}")
+        except Exception:
+            logger.exception("An error occurred while creating emoji:")
             await ctx.send("An error occurred while creating the emoji. Please try again later.")
 
     @emojilocker.command(name="set")
@@ -180,45 +333,64 @@ class EmojiLocker(commands.Cog):
 
         # Add backup roles to role restriction, helpful if a role is deleted
         # and the emoji is still restricted to it
-        admin_roles = await self.bot.get_admin_roles(ctx.guild)
-
+        admin_roles = await self.get_admin_roles(ctx.guild)
+        roles = [role, *admin_roles]
+
+        # Edit the emojis a few at a time and report successes and failures in one message each
+        semaphore = asyncio.Semaphore(EMOJI_EDIT_CONCURRENCY)
+        results = await asyncio.gather(*(self._restrict_emoji(emoji, roles, semaphore) for emoji in emojis))
+        restricted = [str(emoji) for emoji, ok in zip(emojis, results, strict=True) if ok]
+        failed = [str(emoji) for emoji, ok in zip(emojis, results, strict=True) if not ok]
+        if restricted:
+            await ctx.send(f"Emoji {' '.join(restricted)} is now restricted to role {role.name}")
+        if failed:
+            await ctx.send(f"An error occurred while restricting emoji {' '.join(failed)}. Please try again later.")
+
+    async def _restrict_emoji(self, emoji: discord.Emoji, roles: list[discord.Role], semaphore) -> bool:
+        """Restrict one emoji to the given roles, retrying on rate limits. Returns whether the edit succeeded."""
         retry_attempts = 5
         backoff_delay = 2
         http_status_rate_limited = 429
 
-        for emoji in emojis:
+        async with semaphore:
             for attempt in range(retry_attempts):
                 try:
-                    await emoji.edit(roles=[role, *admin_roles], reason="Restricting emojis to specific role")
-                    await ctx.send(f"Emoji {emoji} is now restricted to role {role.name}")
-                    break  # Exit the retry loop if successful
+                    await emoji.edit(roles=roles, reason="Restricting emojis to specific role")
                 except HTTPException as e:
                     if e.status == http_status_rate_limited:
-                        retry_after = int(e.response.headers.get("Retry-After", backoff_delay * (2**attempt)))
-                        logger.warning("Rate limited. Retrying in %s seconds", retry_after)
+                        # Wait for the bucket's own reset, plus jitter so concurrent edits don't retry in lockstep
+                        headers = e.response.headers
+                        reset_after = float(
+                            headers.get("X-RateLimit-Reset-After")
+                            or headers.get("Retry-After")
+                            or backoff_delay * (2**attempt)
+                        )
+                        jitter = random.uniform(0, 0.5 * (2**attempt))  # noqa: S311
+                        retry_after = min(reset_after + jitter, MAX_RETRY_DELAY_SECONDS)
+                        logger.warning("Rate limited. Retrying in %.2f seconds", retry_after)
                         await asyncio.sleep(retry_after)
                     else:
                         logger.exception("An error occurred while restricting emoji:")
-                        await ctx.send("An error occurred while restricting the emoji. Please try again later.")
-                        break
+                        return False
                 except Exception:
                     logger.exception("An unexpected error occurred while restricting emoji:")
-                    await ctx.send("An unexpected error occurred while restricting the emoji. Please try again later.")
-                    break
+                    return False
+                else:
+                    return True
+        return False
 
     @emojilocker.command(name="unset")
     @commands.has_permissions(manage_roles=True)
     async def unrestrict_emoji(self, ctx):
         """Unrestrict an emoji, allowing all roles to use it."""
-        restricted_emojis = []
-        for emoji in ctx.guild.emojis:
-            if emoji.roles:  # Check if the emoji has roles assigned
-                restricted_emojis.append(emoji)
-            else:
-                # Check if the emoji is restricted to a non-existent role
-                emoji_roles = await self.config.guild(ctx.guild).emoji_roles()
-                if str(emoji.id) in emoji_roles and not ctx.guild.get_role(emoji_roles[str(emoji.id)]["role_id"]):
-                    restricted_emojis.append(emoji)
+        emoji_roles = await self._get_emoji_roles(ctx.guild)
+        restricted_emojis = list(self._restricted_emojis(ctx.guild))
+        # Also offer emojis whose stored restriction points at a role that no longer exists
+        stale_ids = {
+            int(emoji_id) for emoji_id, stored in emoji_roles.items() if not ctx.guild.get_role(stored["role_id"])
+        }
+        if stale_ids:
+            restricted_emojis.extend(emoji for emoji in ctx.guild.emojis if emoji.id in stale_ids and not emoji.roles)
 
         if not restricted_emojis:
             await ctx.send("There are no restricted emojis in this server.")
@@ -235,53 +407,59 @@ class EmojiLocker(commands.Cog):
             return
 
         """List all emojis that are restricted to specific roles."""
-        emojis = ctx.guild.emojis
-        restricted_emojis = [emoji for emoji in emojis if emoji.roles]
+        restricted_emojis = list(self._restricted_emojis(ctx.guild))
 
         if restricted_emojis:
-            # Prepare the data
-            pages = []
-            for i in range(0, len(restricted_emojis), 10):  # Adjust the number as needed
-                page = ""
-                for emoji in restricted_emojis[i : i + 10]:
-                    role_names = [role.name for role in emoji.roles]
-                    page += f"{emoji}: {', '.join(role_names)}\n"
-                pages.append(page)
-
-            if not pages:
-                pages.append("No restricted emojis found.")
-
-            view = PaginatorView(pages)
+            # Ten emojis per page, each page formatted only when the paginator first shows it
+            view = LazyPaginatorView(restricted_emojis, _format_restricted_emoji_page, page_size=10)
 
             await ctx.send("Emojis restricted to specific roles:", view=view)
         else:
             await ctx.send("No emojis are restricted to specific roles in this server.")
 
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self._admin_roles_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._admin_roles_cache.pop(role.guild.id, None)
+        self._restricted_by_guild.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_emojis_update(self, guild: discord.Guild, before, after):
+        self._restricted_by_guild[guild.id] = [emoji for emoji in after if emoji.roles]
+
+    async def _reaction_role(self, reaction, user) -> discord.Role | None:
+        """Return the role a tracked reaction grants, if the reacting member holds one of its allowed roles."""
+        guild = reaction.message.guild
+        emoji_roles = await self._get_emoji_roles(guild)
+        entry = emoji_roles.get(str(reaction.emoji.id))
+        if entry is None:
+            return None
+        role = guild.get_role(entry["role_id"])
+        # Member.get_role checks the member's role ids directly instead of building every Role in user.roles
+        if role is None or not any(user.get_role(role_id) for role_id in entry["roles"]):
+            return None
+        return role
+
     @commands.Cog.listener()
     async def on_reaction_add(self, reaction, user):
-        if user.bot:
+        if user.bot or not self._is_tracked(reaction):
             return
 
-        emoji_roles = await self.config.guild(reaction.message.guild).emoji_roles()
-        if str(reaction.emoji.id) in emoji_roles:
-            role_id = emoji_roles[str(reaction.emoji.id)]["role_id"]
-            allowed_roles = emoji_roles[str(reaction.emoji.id)]["roles"]
-            if any(role.id in allowed_roles for role in user.roles):
-                role = reaction.message.guild.get_role(role_id)
-                await user.add_roles(role)
+        role = await self._reaction_role(reaction, user)
+        if role is not None:
+            self._role_queue.put_nowait((user, role, True))
 
     @commands.Cog.listener()
     async def on_reaction_remove(self, reaction, user):
-        if user.bot:
+        if user.bot or not self._is_tracked(reaction):
             return
 
-        emoji_roles = await self.config.guild(reaction.message.guild).emoji_roles()
-        if str(reaction.emoji.id) in emoji_roles:
-            role_id = emoji_roles[str(reaction.emoji.id)]["role_id"]
-            allowed_roles = emoji_roles[str(reaction.emoji.id)]["roles"]
-            if any(role.id in allowed_roles for role in user.roles):
-                role = reaction.message.guild.get_role(role_id)
-                await user.remove_roles(role)
+        role = await self._reaction_role(reaction, user)
+        if role is not None:
+            self._role_queue.put_nowait((user, role, False))
 
 
 def setup(bot):
@@ -1,12 +1,10 @@
-import json
-from pathlib import Path
-
 from redbot.core.bot import Red
 
+from utilities.config_utils import lazy_end_user_data_statement
+
 from .movieclub import MovieClub
 
-with open(Path(__file__).parent / "info.json") as fp:
-    __red_end_user_data_statement__ = json.load(fp)["end_user_data_statement"]
+__getattr__ = lazy_end_user_data_statement(__file__)
 
 
 async def setup(bot: Red) -> None:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import re
@@ -5,13 +6,18 @@ import unicodedata
 from typing import Any
 from urllib.parse import quote, urlparse, urlunparse
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.parser import HTMLParser
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+RUNTIME_RE = re.compile(r"(\d+)\s*mins")
+
+# Only the parts of the search and review pages we read get built into the tree; the rest is skipped while parsing
+SEARCH_RESULT_STRAINER = SoupStrainer("li")
+REVIEW_STRAINER = SoupStrainer("li", class_="film-detail")
+
 
 def construct_search_url(movie_title: str) -> str:
     try:
@@ -29,21 +35,22 @@ def construct_search_url(movie_title: str) -> str:
         return None
 
 
-def scrape_search_page(search_url: str) -> BeautifulSoup | None:
+async def scrape_search_page(search_url: str, session: aiohttp.ClientSession) -> BeautifulSoup | None:
     try:
-        response = requests.get(search_url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        async with session.get(search_url) as response:
+            response.raise_for_status()
+            content = await response.read()
+        soup = BeautifulSoup(content, "lxml", parse_only=SEARCH_RESULT_STRAINER)
         return soup
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         logger.error(f"Failed to fetch search page: {e}")
         return None
 
 
-def fetch_search_results(movie_title: str) -> list[BeautifulSoup]:
+async def fetch_search_results(movie_title: str, session: aiohttp.ClientSession) -> list[BeautifulSoup]:
     try:
         search_url = construct_search_url(movie_title)
-        soup = scrape_search_page(search_url)
+        soup = await scrape_search_page(search_url, session)
         results = soup.find_all("li") if soup else []
         if results:
             logger.info(f"Successfully fetched {len(results)} search results for {movie_title}.")
@@ -61,7 +68,8 @@ def select_best_search_result(search_results: list[BeautifulSoup], film: str) ->
         film = film.lower()
         # Check each search result
         for result in search_results:
-            title_element = result.select_one("span.film-title-wrapper > a")
+            title_wrapper = result.find("span", class_="film-title-wrapper")
+            title_element = title_wrapper.find("a", recursive=False) if title_wrapper else None
 
             if title_element:
                 # Get movie title excluding the 'small' tag (year)
@@ -82,27 +90,20 @@ def select_best_search_result(search_results: list[BeautifulSoup], film: str) ->
         return None
 
 
-def get_validated_base_url(film: str, year: str | None = None) -> str:
+async def get_validated_base_url(film: str, session: aiohttp.ClientSession, year: str | None = None) -> str:
     film = film.lower()
     base_url = f"https://letterboxd.com/film/{film}"
-    url_with_year = f"{base_url}-{year}" if year else None
-    url_without_year = base_url
-
-    if url_with_year:
-        response = requests.get(url_with_year)
-        if response.status_code == 200:
-            return url_with_year
-        elif response.status_code == 404:
-            response = requests.get(url_without_year)
-            if response.status_code == 200:
-                return url_without_year
+    # Try the year-qualified slug first and only fall back to the bare one when that page doesn't exist
+    candidate_urls = [f"{base_url}-{year}", base_url] if year else [base_url]
 
-    else:
-        response = requests.get(url_without_year)
-        if response.status_code == 200:
-            return url_without_year
+    for url in candidate_urls:
+        async with session.get(url) as response:
+            if response.status == 200:
+                return url
+            if response.status != 404:
+                break
 
-    raise ValueError(f"Invalid movie or year: {response.status_code} {response.reason} for URL: {response.url}")
+    raise ValueError(f"Invalid movie or year: {response.status} {response.reason} for URL: {response.url}")
 
 
 def construct_url(base_url: str, url_type: str) -> str:
@@ -116,33 +117,33 @@ def construct_url(base_url: str, url_type: str) -> str:
         raise ValueError(f"Invalid url_type: {url_type}. Expected 'info', 'reviews', or 'stats'.")
 
 
-def fetch_reviews(url: str) -> str | None:
+async def fetch_reviews(url: str, session: aiohttp.ClientSession) -> str | None:
     """Fetches the reviews from the constructed URL."""
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.text
-    except requests.exceptions.RequestException as e:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+    except aiohttp.ClientError as e:
         logger.error(f"Failed to fetch reviews: {e}")
         return None
 
 
 def parse_review_data(page_content: str) -> list[dict[str, str]]:
-    soup = BeautifulSoup(page_content, "html.parser")
+    soup = BeautifulSoup(page_content, "lxml", parse_only=REVIEW_STRAINER)
     reviews = []
-    for review in soup.select("li.film-detail"):
-        reviewer = review.select_one("strong.name")
+    for review in soup.find_all("li", class_="film-detail"):
+        reviewer = review.find("strong", class_="name")
         reviewer = unicodedata.normalize("NFC", reviewer.get_text()) if reviewer else "Unknown"
-        rating = review.select_one(".rating")
+        rating = review.find(class_="rating")
         rating = unicodedata.normalize("NFC", rating.get_text()) if rating else "No rating"
-        date = review.select_one("span._nobr")
+        date = review.find("span", class_="_nobr")
         date = date.get_text() if date else "Unknown date"
         # Fetching individual paragraphs and joining them with newline characters
-        review_text_section = review.select_one(".body-text")
+        review_text_section = review.find(class_="body-text")
         review_text = ""
         if review_text_section:
-            paragraphs = review_text_section.select("p")
-            review_text = "\n".join([p.get_text() for p in paragraphs])
+            paragraphs = review_text_section.find_all("p")
+            review_text = "\n".join(p.get_text() for p in paragraphs)
         link = review.find("a", class_="context")["href"]
         link = f"https://letterboxd.com{link}" if link else "No link"
         user_profile_link = review.find("a", class_="avatar")["href"]
@@ -162,150 +163,133 @@ def parse_review_data(page_content: str) -> list[dict[str, str]]:
     return reviews
 
 
-def fetch_movie_details(film: str, year: str = None):
-    film = film.lower()
-    url_with_year = construct_url(film, "info")
-    url_without_year = construct_url(film, "info")
-
-    response = requests.get(url_with_year)
-    if response.status_code == 404:
-        response = requests.get(url_without_year)
-
-    if response.status_code == 200:
-        try:
-            url = response.url  # Capture the correct URL from the response
-            parsed_url = urlparse(url)
-            cleaned_path = "/".join(segment for segment in parsed_url.path.split("/") if segment)
-            url = urlunparse(parsed_url._replace(path=cleaned_path))
-
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Get the necessary data
-            title_section = soup.find("section", {"id": "featured-film-header"})
-            title = title_section.find("h1", class_="headline-1").get_text() if title_section else None
-
-            year_of_release = (
-                soup.find("small", class_="number").find("a").text if soup.find("small", class_="number") else None
-            )
-            tagline = soup.find("h4", class_="tagline").text if soup.find("h4", class_="tagline") else None
-            description = (
-                soup.find("div", class_="truncate").find("p").text if soup.find("div", class_="truncate") else None
-            )
-            genres = (
-                [
-                    a.text
-                    for a in soup.find("div", id="tab-genres")
-                    .find("div", class_="text-sluglist capitalize")
-                    .find_all("a", class_="text-slug")
-                ]
-                if soup.find("div", id="tab-genres")
-                else None
-            )
-
-            runtime_paragraph = soup.find("p", class_="text-link text-footer")
-            if runtime_paragraph:
-                runtime_text = runtime_paragraph.get_text()
-                runtime_match = re.search(r"(\d+)\s*mins", runtime_text)
-                if runtime_match:
-                    runtime = int(
-                        runtime_match.group(1).replace(",", "")
-                    )  # Convert to integer after removing any commas
-                else:
-                    runtime = None
-            else:
-                runtime = None
-
-            trailer_link_section = soup.find("p", class_="trailer-link js-watch-panel-trailer")
-            if trailer_link_section:
-                trailer_link_a = trailer_link_section.find("a")
-                if trailer_link_a and trailer_link_a.has_attr("href"):
-                    trailer_link = trailer_link_a["href"]
-                    if trailer_link.startswith("//"):
-                        trailer_link = "https:" + trailer_link
-                else:
-                    trailer_link = None
-            else:
-                trailer_link = None
-
-            # Extract the backdrop image URL
-            backdrop_div = soup.find("div", id="backdrop")
-            if backdrop_div and backdrop_div.has_attr("data-backdrop"):
-                image_url = backdrop_div["data-backdrop"]
-            else:
-                image_url = None
-
-            # Get the ratings
-            script_tag = soup.find("script", type="application/ld+json")
-            if script_tag:
-                script_text = script_tag.string
-                clean_script_text = script_text.replace("/* <![CDATA[ */", "").replace("/* ]]> */", "")
-                script_json = json.loads(clean_script_text)
-                aggregate_rating = script_json.get("aggregateRating", {})
-                average_rating = aggregate_rating.get("ratingValue")
-                number_of_reviewers = aggregate_rating.get("reviewCount") or aggregate_rating.get("ratingCount")
-            else:
-                average_rating = None
-                number_of_reviewers = None
-
-            # Step 3: Data Parsing
-            movie_data = {
-                "title": title,
-                "year_of_release": year_of_release,
-                "description": description,
-                "tagline": tagline,
-                "genres": genres,
-                "runtime": runtime,
-                "average_rating": average_rating,
-                "number_of_reviewers": number_of_reviewers,
-                "trailer_link": trailer_link,
-                "letterboxd_link": url,
-                "banner_image": image_url,
-            }
+async def fetch_movie_details(film: str, session: aiohttp.ClientSession, year: str | None = None):
+    url = construct_url(film.lower(), "info")
 
-            return movie_data
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                logger.error(
+                    f"Failed to fetch data for {film} ({year}) due to: {response.status} {response.reason} for url: {response.url}"
+                )
+                return None
+            url = str(response.url)  # Capture the correct URL from the response
+            page_content = await response.read()
+    except aiohttp.ClientError as e:
+        logger.error(f"Failed to fetch data for {film} ({year}) due to: {e!s}")
+        return None
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch data for {film} ({year}) due to: {e!s}")
-            return None
+    return parse_movie_details(page_content, url)
 
-    else:
-        logger.error(
-            f"Failed to fetch data for {film} ({year}) due to: {response.status_code} {response.reason} for url: {response.url}"
-        )
-        return None, None
 
+def parse_movie_details(page_content: bytes, url: str) -> dict[str, Any]:
+    parsed_url = urlparse(url)
+    cleaned_path = "/".join(segment for segment in parsed_url.path.split("/") if segment)
+    url = urlunparse(parsed_url._replace(path=cleaned_path))
+
+    tree = HTMLParser(page_content)
 
-def fetch_letterboxd_details_wrapper(film: str) -> dict[str, str | Any]:
+    # Get the necessary data
+    title_node = tree.css_first("section#featured-film-header h1.headline-1")
+    title = title_node.text() if title_node else None
+
+    year_node = tree.css_first("small.number a")
+    year_of_release = year_node.text() if year_node else None
+    tagline_node = tree.css_first("h4.tagline")
+    tagline = tagline_node.text() if tagline_node else None
+    description_node = tree.css_first("div.truncate p")
+    description = description_node.text() if description_node else None
+    # The tab's first sluglist holds the genres; later ones are themes and nanogenres
+    genre_list = tree.css_first("div#tab-genres div.text-sluglist.capitalize")
+    genres = [a.text() for a in genre_list.css("a.text-slug")] if genre_list else None
+
+    runtime_paragraph = tree.css_first("p.text-link.text-footer")
+    if runtime_paragraph:
+        runtime_text = runtime_paragraph.text()
+        runtime_match = RUNTIME_RE.search(runtime_text)
+        if runtime_match:
+            runtime = int(runtime_match.group(1).replace(",", ""))  # Convert to integer after removing any commas
+        else:
+            runtime = None
+    else:
+        runtime = None
+
+    trailer_link_a = tree.css_first("p.trailer-link.js-watch-panel-trailer a")
+    trailer_link = trailer_link_a.attributes.get("href") if trailer_link_a else None
+    if trailer_link and trailer_link.startswith("//"):
+        trailer_link = "https:" + trailer_link
+
+    # Extract the backdrop image URL
+    backdrop_div = tree.css_first("div#backdrop")
+    image_url = backdrop_div.attributes.get("data-backdrop") if backdrop_div else None
+
+    # Get the ratings
+    script_tag = tree.css_first('script[type="application/ld+json"]')
+    if script_tag:
+        script_text = script_tag.text()
+        clean_script_text = script_text.replace("/* <![CDATA[ */", "").replace("/* ]]> */", "")
+        script_json = json.loads(clean_script_text)
+        aggregate_rating = script_json.get("aggregateRating", {})
+        average_rating = aggregate_rating.get("ratingValue")
+        number_of_reviewers = aggregate_rating.get("reviewCount") or aggregate_rating.get("ratingCount")
+    else:
+        average_rating = None
+        number_of_reviewers = None
+
+    # Step 3: Data Parsing
+    movie_data = {
+        "title": title,
+        "year_of_release": year_of_release,
+        "description": description,
+        "tagline": tagline,
+        "genres": genres,
+        "runtime": runtime,
+        "average_rating": average_rating,
+        "number_of_reviewers": number_of_reviewers,
+        "trailer_link": trailer_link,
+        "letterboxd_link": url,
+        "banner_image": image_url,
+    }
+
+    return movie_data
+
+
+async def find_letterboxd_url(film: str, session: aiohttp.ClientSession) -> str | None:
     try:
         logger.info(f"Fetching search results for {film} on Letterboxd...")
-        results = fetch_search_results(film)
+        results = await fetch_search_results(film, session)
 
         if not results:
             logger.error(f"No search results found for {film}.")
-            return {}
+            return None
 
         selected_url = select_best_search_result(results, film)
         if not selected_url:
             logger.warning(f"No suitable match found for {film}. There are no exact matches in the search results.")
-            return {}
+            return None
+
+        return selected_url.rstrip("/")
+    except Exception as e:
+        logger.error(f"An error occurred while searching Letterboxd for {film}: {e!s}")
+        return None
 
-        movie_data = fetch_movie_details(selected_url)
+
+async def fetch_letterboxd_details_wrapper(film_url: str, session: aiohttp.ClientSession) -> dict[str, str | Any]:
+    try:
+        movie_data = await fetch_movie_details(film_url, session)
 
         if movie_data:
-            logger.info(f"Successfully fetched and parsed movie data for {film}.")
+            logger.info(f"Successfully fetched and parsed movie data for {film_url}.")
             return movie_data
         else:
-            logger.error(f"Failed to fetch and parse data for {film}.")
+            logger.error(f"Failed to fetch and parse data for {film_url}.")
             return {}
-    except (
-        requests.RequestException,
-        Exception,
-    ) as e:  # Catch and log possible network and parsing errors
-        logger.error(f"An error occurred while fetching movie details for {film}: {e!s}")
+    except Exception as e:  # Catch and log possible network and parsing errors
+        logger.error(f"An error occurred while fetching movie details for {film_url}: {e!s}")
         return {}
 
 
-def main() -> None:
+async def main() -> None:
     test_cases = [
         {"film": "The Great Escape", "year": "1963"},
         {"film": "Surf Ninjas"},
@@ -316,47 +300,49 @@ def main() -> None:
         {"film": "Love on a Leash"},
         {"film": "10½"},
     ]
-    for test_case in test_cases:
-        film = test_case["film"]
-        year = test_case.get("year")  # Use get method to avoid KeyError if "year" key is not present
-        try:
-            # Fetching search results and selecting the best match
-            logger.info(f"Fetching search results for {film} ({year if year else ''})...")
-            results = fetch_search_results(film)
-
-            if results:
-                selected_url = select_best_search_result(results, film)
-                if selected_url is not None:
-                    # Fetching and logging movie data
-                    logger.info(f"Fetching data for {film} ({year if year else ''})...")
-                    movie_data = fetch_movie_details(selected_url)
-                    if movie_data:
-                        logger.info(f"Successfully fetched data for {film} ({year if year else ''}).")
-                        print(json.dumps(movie_data, indent=2))
-                    else:
-                        logger.error(f"Failed to fetch data for {film} ({year if year else ''}).")
-                    # Fetching and logging reviews
-                    logger.info(f"Fetching reviews for {film} ({year if year else ''})...")
-                    review_url = construct_url(selected_url, "reviews")
-                    page_content = fetch_reviews(review_url)
-                    if page_content:
-                        reviews = parse_review_data(page_content)
-                        if reviews:
-                            logger.info(f"Successfully fetched reviews for {film} ({year if year else ''}).")
-                            print(json.dumps(reviews, indent=2))
+    async with aiohttp.ClientSession() as session:
+        for test_case in test_cases:
+            film = test_case["film"]
+            year = test_case.get("year")  # Use get method to avoid KeyError if "year" key is not present
+            try:
+                # Fetching search results and selecting the best match
+                logger.info(f"Fetching search results for {film} ({year if year else ''})...")
+                results = await fetch_search_results(film, session)
+
+                if results:
+                    selected_url = select_best_search_result(results, film)
+                    if selected_url is not None:
+                        # Fetching and logging movie data
+                        logger.info(f"Fetching data for {film} ({year if year else ''})...")
+                        movie_data = await fetch_movie_details(selected_url, session)
+                        if movie_data:
+                            logger.info(f"Successfully fetched data for {film} ({year if year else ''}).")
+                            print(json.dumps(movie_data, indent=2))
+                        else:
+                            logger.error(f"Failed to fetch data for {film} ({year if year else ''}).")
+                        # Fetching and logging reviews
+                        logger.info(f"Fetching reviews for {film} ({year if year else ''})...")
+                        review_url = construct_url(selected_url, "reviews")
+                        page_content = await fetch_reviews(review_url, session)
+                        if page_content:
+                            reviews = parse_review_data(page_content)
+                            if reviews:
+                                logger.info(f"Successfully fetched reviews for {film} ({year if year else ''}).")
+                                print(json.dumps(reviews, indent=2))
+                            else:
+                                logger.warning(f"No reviews found for {film} ({year if year else ''}).")
                         else:
-                            logger.warning(f"No reviews found for {film} ({year if year else ''}).")
+                            logger.error(f"Failed to fetch reviews for {film} ({year if year else ''}).")
                     else:
-                        logger.error(f"Failed to fetch reviews for {film} ({year if year else ''}).")
+                        logger.error(f"No suitable search result selected for {film} ({year if year else ''}).")
+                        continue
                 else:
-                    logger.error(f"No suitable search result selected for {film} ({year if year else ''}).")
+                    logger.error(f"Failed to fetch search results for {film} ({year if year else ''}).")
                     continue
-            else:
-                logger.error(f"Failed to fetch search results for {film} ({year if year else ''}).")
-                continue
-        except ValueError as e:
-            logger.error(f"Failed to process {film} ({year if year else ''}) due to: {e!s}")
+            except ValueError as e:
+                logger.error(f"Failed to process {film} ({year if year else ''}) due to: {e!s}")
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
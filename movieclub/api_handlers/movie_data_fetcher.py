@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from typing import Any
@@ -6,7 +7,7 @@ import discord
 from dotenv import load_dotenv
 import aiohttp
 
-from movieclub.api_handlers.letterboxd import construct_url, fetch_reviews, parse_review_data
+from movieclub.api_handlers.letterboxd import construct_url, fetch_reviews, find_letterboxd_url, parse_review_data
 from movieclub.api_handlers.letterboxd import fetch_letterboxd_details_wrapper as fetch_letterboxd_details
 from movieclub.api_handlers.tmdb import fetch_movie_details as fetch_tmdb_details
 
@@ -14,59 +15,79 @@ from movieclub.api_handlers.tmdb import fetch_movie_details as fetch_tmdb_detail
 load_dotenv(os.path.join(os.path.dirname(__file__), "../../../.env"))
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-
-
 class MovieDataFetcher:
     def __init__(self):
-        self.session = None
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared session, created lazily so keep-alive connections are reused across lookups."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300))
+        return self._session
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.close()
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _fetch_letterboxd(self, movie_name: str, session: aiohttp.ClientSession):
+        """Return the film's Letterboxd details and its parsed reviews, or ({}, None) when it isn't found."""
+        letterboxd_url = await find_letterboxd_url(movie_name, session)
+        if not letterboxd_url:
+            return {}, None
+
+        letterboxd_details = await fetch_letterboxd_details(letterboxd_url, session)
+        if "letterboxd_link" not in letterboxd_details:
+            return letterboxd_details, None
+
+        # Build the reviews URL from the film page's final URL, after any redirect from the search slug
+        review_url = construct_url(letterboxd_details["letterboxd_link"], "reviews")
+        review_page_content = await fetch_reviews(review_url, session)
+        reviews = parse_review_data(review_page_content) if review_page_content else None
+        return letterboxd_details, reviews
 
     async def fetch_movie_info(self, movie_name: str):
         try:
-            async with self as fetcher:
-                logging.info(f"Fetching movie data for: {movie_name}")
-
-                tmdb_details = fetch_tmdb_details(movie_name)
-
-                letterboxd_details = fetch_letterboxd_details(movie_name)
-                logging.info(f"Letterboxd details: {letterboxd_details}")
-                if "letterboxd_link" in letterboxd_details:
-                    review_url = construct_url(letterboxd_details["letterboxd_link"], "reviews")
-                    review_page_content = fetch_reviews(review_url)
-                    reviews = parse_review_data(review_page_content) if review_page_content else None
-                else:
-                    reviews = None
-
-                movie_data: dict[str, str | Any] = {
-                    "title": letterboxd_details.get("title", "") or tmdb_details.get("title", ""),
-                    "year_of_release": letterboxd_details.get("year_of_release", "") or tmdb_details.get("year_of_release", ""),
-                    "tagline": letterboxd_details.get("tagline", "") or tmdb_details.get("tagline", ""),
-                    "description": letterboxd_details.get("description", "") or tmdb_details.get("description", ""),
-                    "genre": letterboxd_details.get("genres", []) or tmdb_details.get("genres", []),
-                    "runtime": letterboxd_details.get("runtime", 0) or tmdb_details.get("runtime", 0),
-                    "rating": letterboxd_details.get("average_rating", "N/A"),
-                    "reviews": reviews,
-                    "number_of_reviewers": letterboxd_details.get("number_of_reviewers", 0),
-                    "trailer_url": letterboxd_details.get("trailer_link", "") or tmdb_details.get("trailer_link", ""),
-                    "letterboxd_link": letterboxd_details.get("letterboxd_link", ""),
-                    "banner_image": letterboxd_details.get("banner_image", ""),
-                }
-
-                logging.info("Fetched and normalized movie data.")
-                return movie_data
+            logging.info(f"Fetching movie data for: {movie_name}")
+
+            session = self.session
+            # TMDB and Letterboxd don't depend on each other, so the TMDB lookup runs alongside the whole
+            # Letterboxd search -> film page -> reviews chain instead of before it. A TaskGroup cancels the
+            # other lookup if one fails, rather than leaving it running against the shared session.
+            async with asyncio.TaskGroup() as tg:
+                tmdb_task = tg.create_task(fetch_tmdb_details(movie_name, session))
+                letterboxd_task = tg.create_task(self._fetch_letterboxd(movie_name, session))
+            tmdb_details = tmdb_task.result() or {}
+            letterboxd_details, reviews = letterboxd_task.result()
+            logging.info(f"Letterboxd details: {letterboxd_details}")
+
+            movie_data: dict[str, str | Any] = {
+                "title": letterboxd_details.get("title", "") or tmdb_details.get("title", ""),
+                "year_of_release": letterboxd_details.get("year_of_release", "") or tmdb_details.get("year_of_release", ""),
+                "tagline": letterboxd_details.get("tagline", "") or tmdb_details.get("tagline", ""),
+                "description": letterboxd_details.get("description", "") or tmdb_details.get("description", ""),
+                "genre": letterboxd_details.get("genres", []) or tmdb_details.get("genres", []),
+                "runtime": letterboxd_details.get("runtime", 0) or tmdb_details.get("runtime", 0),
+                "rating": letterboxd_details.get("average_rating", "N/A"),
+                "reviews": reviews,
+                "number_of_reviewers": letterboxd_details.get("number_of_reviewers", 0),
+                "trailer_url": letterboxd_details.get("trailer_link", "") or tmdb_details.get("trailer_link", ""),
+                "letterboxd_link": letterboxd_details.get("letterboxd_link", ""),
+                "banner_image": letterboxd_details.get("banner_image", ""),
+            }
+
+            logging.info("Fetched and normalized movie data.")
+            return movie_data
         except Exception as e:
             error_msg = f"Error in fetch_movie_info for {movie_name}: {e}"
             logging.error(error_msg, exc_info=True)
-            return None, None
+            return None
 
 
 def select_review(reviews: list[dict[str, str | Any]]) -> str | None:
@@ -148,18 +169,23 @@ def movie_data_to_discord_format(movie_data: dict[str, Any]) -> dict[str, Any]:
         raise
 
 
-def get_movie_discord_embed(movie_name: str) -> dict[str, Any]:
-    try:
-        movie_data, discord_format = asyncio.run(MovieDataFetcher().fetch_movie_info(movie_name))
-        if movie_data:
-            discord_format = movie_data_to_discord_format(movie_data)
-            if discord_format:
-                logging.info(f"Generated Discord message for {movie_name}.")
-                logging.info(f"Discord message: {discord_format}")
-                return movie_data, discord_format
-        else:
-            msg = f"Failed to fetch movie data for {movie_name}."
-            raise Exception(msg)
-    except Exception as e:
-        logging.error(f"An error occurred in gather_movie_info: {e}", exc_info=True)
-        return {}
+# One fetcher per process so every lookup shares its session instead of opening and closing its own
+_movie_data_fetcher = MovieDataFetcher()
+
+
+async def get_movie_data(movie_name: str) -> dict[str, Any] | None:
+    """
+    Fetches a movie's normalized data without building its embed.
+
+    Callers format it with movie_data_to_discord_format only once they know the embed will be sent.
+    """
+    movie_data = await _movie_data_fetcher.fetch_movie_info(movie_name)
+    if not movie_data:
+        logging.error(f"Failed to fetch movie data for {movie_name}.")
+        return None
+    return movie_data
+
+
+async def close_movie_data_fetcher() -> None:
+    """Close the shared fetcher's session; the next lookup opens a fresh one."""
+    await _movie_data_fetcher.close()
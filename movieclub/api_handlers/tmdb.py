@@ -1,10 +1,14 @@
+import asyncio
+import functools
 import logging
 import os
 from typing import Any
 
-import requests
+import aiohttp
 from dotenv import load_dotenv
 
+API_BASE_URL = "https://api.themoviedb.org/3"
+
 
 def configure_logging():
     """
@@ -20,15 +24,31 @@ def load_environment_variables():
     load_dotenv(os.path.join(os.path.dirname(__file__), "../../../.env"))
 
 
-def make_request(url: str, params: dict[str, Any]) -> dict[str, Any]:
+@functools.cache
+def tmdb_api_key() -> str:
+    """
+    Return the TMDB_API_KEY environment variable, read once per process.
+
+    Raises:
+    ------
+        OSError: If TMDB_API_KEY is not set.
+
+    """
+    api_key = os.environ.get("TMDB_API_KEY")
+    if not api_key:
+        raise OSError("TMDB_API_KEY not found in environment variables.")
+    return api_key
+
+
+async def make_request(session: aiohttp.ClientSession, url: str, params: dict[str, Any]) -> dict[str, Any]:
     """
     Makes a GET request to the specified URL with the given parameters and returns the JSON response.
     """
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException:
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+            return await response.json()
+    except aiohttp.ClientError:
         logging.exception("Error making request to %s", url)
         return None
 
@@ -40,7 +60,7 @@ def extract_movie_details(movie_data: dict[str, Any]) -> dict[str, Any]:
     genres = [genre["name"] for genre in movie_data.get("genres", [])]
     return {
         "title": movie_data.get("title", "N/A"),
-        "year_of_release": int(movie_data["release_date"].split("-")[0]) if movie_data.get("release_date") else "N/A",
+        "year_of_release": int(movie_data["release_date"].partition("-")[0]) if movie_data.get("release_date") else "N/A",
         "tagline": movie_data.get("tagline", "N/A"),
         "genres": genres,
         "runtime": movie_data.get("runtime", "N/A"),
@@ -53,21 +73,14 @@ def extract_movie_details(movie_data: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def fetch_movie_details(movie_name: str) -> dict[str, Any] | None:
+async def fetch_movie_details(movie_name: str, session: aiohttp.ClientSession) -> dict[str, Any] | None:
     """
     Fetches movie details from TMDb API by movie name.
     """
-    API_BASE_URL = "https://api.themoviedb.org/3"
-    API_KEY = os.getenv("TMDB_API_KEY")
-
-    if not API_KEY:
-        logging.error("TMDB_API_KEY not found in environment variables.")
-        exit(1)
-
     # Step 1: Search for the movie to get its ID
     search_url = f"{API_BASE_URL}/search/movie"
-    params = {"api_key": API_KEY, "query": movie_name}
-    data = make_request(search_url, params)
+    params = {"api_key": tmdb_api_key(), "query": movie_name}
+    data = await make_request(session, search_url, params)
     if not data or not data["results"]:
         logging.error(f"No results found for the movie name: {movie_name}")
         return None
@@ -77,7 +90,7 @@ def fetch_movie_details(movie_name: str) -> dict[str, Any] | None:
     # Step 2: Use the movie ID to fetch detailed info
     movie_url = f"{API_BASE_URL}/movie/{movie_id}"
     params["append_to_response"] = "videos"  # Include videos (for trailer link) in the response
-    movie_data = make_request(movie_url, params)
+    movie_data = await make_request(session, movie_url, params)
     if not movie_data:
         return None
 
@@ -85,15 +98,16 @@ def fetch_movie_details(movie_name: str) -> dict[str, Any] | None:
     return extract_movie_details(movie_data)
 
 
-def main():
+async def main():
     """
     The main function to execute the script.
     """
     configure_logging()
     load_environment_variables()
-    movie_details = fetch_movie_details("Inception")
+    async with aiohttp.ClientSession() as session:
+        movie_details = await fetch_movie_details("Inception", session)
     logging.info(movie_details)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
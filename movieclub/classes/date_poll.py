@@ -1,4 +1,5 @@
 # Standard imports
+import asyncio
 import calendar
 import datetime
 import logging
@@ -20,6 +21,9 @@ from movieclub.classes.poll import Poll
 from movieclub.constants import MOVIE_CLUB_LOGO
 from utilities.date_utils import DateUtil
 
+# How long auto_close_if_due waits before retrying after an error (the old polling interval)
+AUTO_CLOSE_RETRY_SECONDS = 30 * 60
+
 
 def last_days_of_month(input_date: date, final_days: int = 14) -> list[date]:
     """Find the last days in a given month and return as a list."""
@@ -107,6 +111,9 @@ class DatePollButton(ui.Button):
     def __init__(self, date: date, config, guild, poll_id):
         super().__init__(style=ButtonStyle.primary, label=DateUtil.get_presentable_date(date))
         self.date = DateUtil.normalize_date(date)
+        # The button's date never changes, so format its display string and vote key once
+        self.date_str = self.label
+        self.date_key = self.date.isoformat()
         logging.debug(f"Creating DatePollButton for date: {self.date}")
 
         self.config = config
@@ -132,14 +139,14 @@ class DatePollButton(ui.Button):
         # let Discord know we received the interaction so it doesn't time us out
         # in case it takes a while to respond for some reason
         await interaction.response.defer()
-        date_str = DateUtil.get_presentable_date(self.date)  # Convert datetime to string for display
+        date_str = self.date_str
         user_id = str(interaction.user.id)
 
         logging.debug("Fetching current votes and user votes")
         votes = defaultdict(int, await self.get_votes())
         date_user_votes = defaultdict(dict, await self.get_user_votes())
         logging.debug(f"Fetched votes: {votes} and user votes: {date_user_votes}")
-        date_key = self.date.strftime("%Y-%m-%d")  # Convert datetime to string for a dictionary key
+        date_key = self.date_key
         date_votes = defaultdict(bool, date_user_votes[date_key])
 
         logging.debug(f"user_id initial type: {type(user_id)}")
@@ -168,19 +175,20 @@ class DatePollButton(ui.Button):
         logging.debug(f"Users that voted for above date: {date_votes}")
         self.label = f"{date_str} ({votes[date_key]})"  # Show the votes for the updated date
 
-        unique_voters = set()
-        for user_vote_list in date_user_votes.values():
-            unique_voters.update(user_vote_list.keys())
+        unique_voters = set().union(*date_user_votes.values())
         logging.debug(f"Unique voters: {unique_voters}")
 
         target_role = await self.get_target_role()
         if target_role:
-            target_role = discord.utils.get(interaction.guild.roles, id=target_role)
+            target_role = interaction.guild.get_role(target_role)
             target_role_member_ids = (
-                set(str(member.id) for member in target_role.members) if target_role else {interaction.guild.members}
+                {str(member.id) for member in target_role.members}
+                if target_role
+                else {str(member.id) for member in interaction.guild.members}
             )
         else:
-            target_role_member_ids = set(member.id for member in interaction.guild.members)
+            # Voter keys are string IDs (JSON), so compare against string member IDs
+            target_role_member_ids = {str(member.id) for member in interaction.guild.members}
         logging.debug(f"Target role member IDs: {target_role_member_ids}")
 
         unique_role_voters = unique_voters.intersection(
@@ -213,11 +221,10 @@ class DatePollButton(ui.Button):
         voted_dates = [date for date in votes.keys() if user_id in date_user_votes.get(date, {})]
 
         def get_sorted_presentable_dates(dates):
-            datetime_dates = [
-                datetime.datetime.strptime(date, "%Y-%m-%d") for date in dates
-            ]  # Convert stringified dates back to datetime
-            sorted_dates = DateUtil.sort_dates(datetime_dates)  # Adjust this function to accept datetime formats
-            return "\n- ".join(DateUtil.get_presentable_date(date) for date in sorted_dates)
+            # Vote keys are zero-padded YYYY-MM-DD, so string order is date order; only parse for display
+            return "\n- ".join(
+                DateUtil.get_presentable_date(datetime.date.fromisoformat(date)) for date in sorted(dates)
+            )
 
         # The part of the code where you check and format the dates
         if voted_dates:
@@ -277,12 +284,12 @@ class DatePoll(Poll):
                         candidate_dates = last_days_of_month(current_date)
                         us_holidays = CustomHolidays(years=delta_days_from_current_date.year)
                     else:
-                        candidate_dates = last_days_of_month(current_date)
                         us_holidays = CustomHolidays(years=current_date.year)
-                        # remove days that are less than 14 days from today
-                        for date in candidate_dates:
-                            if delta_days_from_current_date > date:
-                                candidate_dates.remove(date)
+                        # Keep only days at least 14 days from today; one filtered pass rather than
+                        # list.remove() while iterating, which was O(n^2) and skipped the element after each removal
+                        candidate_dates = [
+                            date for date in last_days_of_month(current_date) if date >= delta_days_from_current_date
+                        ]
 
                     filtered_candidate_dates = get_filtered_candidate_dates(candidate_dates, us_holidays)
                     logging.debug(f"Filtered dates: {', '.join(map(str, filtered_candidate_dates))}")
@@ -335,7 +342,7 @@ class DatePoll(Poll):
                 await ctx.send("An error occurred while trying to send the poll message. Please try again later.")
                 return
 
-            date_strings = [date.strftime("%a, %b %d, %Y") for date in dates]
+            date_strings = [DateUtil.get_presentable_date(date) for date in dates]
             await self.add_buttons(date_strings)
 
             close_weeks_before = 1  # For example, make this configurable
@@ -350,6 +357,7 @@ class DatePoll(Poll):
                 await self.config.guild(ctx.guild).polls.set_raw(
                     self.poll_id, "scheduled_close_date", value=poll_end_date.isoformat()
                 )
+                self._start_auto_close()
         except Exception as e:
             logging.exception(f"Failed to send poll message: {e}")
             await ctx.send("An error occurred while trying to send the poll message. Please try again later.")
@@ -374,10 +382,10 @@ class DatePoll(Poll):
                 tied_message = f"\u200B\n{MOVIE_CLUB_LOGO}\n\n The most voted date is:\n\n"
             date_user_votes = await self.get_user_votes()
             for most_voted_date in most_voted_dates:
-                date_to_check = datetime.datetime.strptime(most_voted_date, "%Y-%m-%d")
-                presentable_date = DateUtil.get_presentable_date(date_to_check)
-                str_date_to_check = date_to_check.strftime("%Y-%m-%d")
-                user_votes = date_user_votes.get(str_date_to_check, {})
+                # Poll keys are ISO dates: parse with fromisoformat and look votes up by the key itself,
+                # rather than strptime followed by strftime back to the same string
+                presentable_date = DateUtil.get_presentable_date(datetime.date.fromisoformat(most_voted_date))
+                user_votes = date_user_votes.get(most_voted_date, {})
                 user_ids = ", ".join(f"<@{user_id}>" for user_id in user_votes.keys())
                 tied_message += f"**{presentable_date}**\nAvailable: {user_ids}\n\n"
 
@@ -421,11 +429,13 @@ class DatePoll(Poll):
         dates = [DateUtil.str_to_date(date_string) for date_string in date_strings]  # Converted line to use DateUtil
         view = DatePollView(dates, self.config, self.guild, self.poll_id)
         await poll_message.edit(view=view)
+        self._start_auto_close()
 
     async def build_view(self):
         date_strings = await self.get_buttons()
         logging.debug(f"Date strings: {date_strings}")
-        dates = [datetime.datetime.strptime(date_string, "%a, %b %d, %Y") for date_string in date_strings]
+        # DateUtil memoizes the parse, so the periodic keep-alive rebuild doesn't re-run strptime each time
+        dates = [DateUtil.str_to_date(date_string) for date_string in date_strings]
         return DatePollView(dates, self.config, self.guild, self.poll_id)
 
     def send_initial_message(self):
@@ -445,26 +455,40 @@ class DatePoll(Poll):
         # Implement the method here
         pass
 
-    @tasks.loop(minutes=30)
+    def _start_auto_close(self):
+        if not self.auto_close_if_due.is_running():
+            self.auto_close_if_due.start()
+
+    async def _get_scheduled_close_date(self) -> date | None:
+        scheduled_close_date_str = await self.config.guild(self.guild).polls.get_raw(
+            self.poll_id, "scheduled_close_date", default=None
+        )
+        return datetime.date.fromisoformat(scheduled_close_date_str) if scheduled_close_date_str else None
+
+    @tasks.loop()
     async def auto_close_if_due(self):
         """
-        Periodically check if the poll is past the scheduled close date.
-        If so, end it automatically.
+        Sleep until the poll's scheduled close date, then end it automatically.
+        The close date is read once per run instead of being re-checked on a fixed interval.
         """
         try:
-            scheduled_close_date_str = await self.config.guild(self.guild).polls.get_raw(
-                self.poll_id, "scheduled_close_date", default=None
-            )
-            if not scheduled_close_date_str:
-                return
-            scheduled_close_date = datetime.datetime.fromisoformat(scheduled_close_date_str).date()
-            if datetime.date.today() >= scheduled_close_date:
-                # Time to close the poll
-                ctx_channel_id = await self.get_poll_channel_id()
-                channel = self.bot.get_channel(ctx_channel_id)
-                if channel:
-                    dummy_ctx = await self.bot.get_context(await channel.fetch_message(await self.get_message_id()))
-                    await self.end_poll(dummy_ctx)
+            scheduled_close_date = await self._get_scheduled_close_date()
+            if not scheduled_close_date:
                 self.auto_close_if_due.cancel()
+                return
+            # Local midnight of the close date; returns immediately if that is already in the past
+            await discord.utils.sleep_until(datetime.datetime.combine(scheduled_close_date, datetime.time.min).astimezone())
+            # The date may have moved, or the poll ended, while sleeping; the next run picks up the new date
+            if await self._get_scheduled_close_date() != scheduled_close_date:
+                return
+
+            ctx_channel_id = await self.get_poll_channel_id()
+            channel = self.bot.get_channel(ctx_channel_id)
+            if channel:
+                dummy_ctx = await self.bot.get_context(await channel.fetch_message(await self.get_message_id()))
+                await self.end_poll(dummy_ctx)
+            self.auto_close_if_due.cancel()
         except Exception as e:
             logging.exception(f"Error in auto_close_if_due for {self.poll_id}: {e}")
+            # Back off before the loop retries so a persistent error doesn't spin
+            await asyncio.sleep(AUTO_CLOSE_RETRY_SECONDS)
@@ -18,6 +18,9 @@ from utilities.discord_utils import create_discord_thread
 
 MAX_BUTTON_LABEL_SIZE = 16
 MAX_BUTTONS_IN_ROW = 5
+PARTICIPATION_RE = re.compile(
+    r"(<:fingercrossed:1103626715663712286> \d+ movie club passholder(s)? voted, \d+ more to go! \(\d+(\.\d+)?% participation\)\n\u200B)"
+)
 
 first_vote_endings = [
     "You know what's going on in the world. You know what culture looks like, you know the names of trends, and you certainly know what movie to vote for.",
@@ -295,7 +298,7 @@ class MoviePoll(Poll):
                 logging.warning(NO_TARGET_ROLE_MSG)
                 await ctx.send(NO_TARGET_ROLE_MSG)
                 return
-            target_role = discord.utils.get(ctx.guild.roles, id=target_role_id)
+            target_role = ctx.guild.get_role(target_role_id)
             if not target_role:
                 logging.error(TARGET_ROLE_NOT_FOUND_MSG)
                 await ctx.send(TARGET_ROLE_NOT_FOUND_MSG)
@@ -308,8 +311,8 @@ class MoviePoll(Poll):
                 return
 
             all_movies = await self.get_stored_movies()
-            target_role_member_ids = set(member.id for member in target_role.members)
-            voted_member_ids = set(int(user_id) for user_id in user_votes)
+            target_role_member_ids = {member.id for member in target_role.members}
+            voted_member_ids = {int(user_id) for user_id in user_votes}
             non_voters = target_role_member_ids - voted_member_ids
 
             movie_votes: dict[str, list[str]] = {movie: [] for movie in all_movies}
@@ -328,7 +331,7 @@ class MoviePoll(Poll):
                     message_lines.append(f"\u200B\n{title} (No votes, RIP)")
 
             if non_voters:
-                non_voter_mentions = ", ".join([f"<@{member_id}>" for member_id in non_voters])
+                non_voter_mentions = ", ".join(f"<@{member_id}>" for member_id in non_voters)
                 # TODO: add logic to handle target_role or entire guild depending on settings
                 message_lines.append(f"\nPeople who have not voted: {non_voter_mentions}")
 
@@ -349,23 +352,22 @@ class MoviePoll(Poll):
 
         async def update_percentage_voted_text(self, interaction: discord.Interaction):
             # Your logic for updating the message goes here
-            unique_voters = set()
-            user_votes = defaultdict(dict, await self.movie_poll.get_user_votes())
-            logging.info(f"update percentage User votes: {user_votes.keys()}")
-            for user in user_votes.keys():
-                unique_voters.add(user)
+            # user_votes is keyed by voter id, so its keys are already the unique voters
+            unique_voters = set(await self.movie_poll.get_user_votes())
+            logging.info(f"update percentage User votes: {unique_voters}")
             logging.debug(f"update percentage unique voters: {unique_voters}")
 
             target_role = await self.movie_poll.get_target_role()
             if target_role:
-                target_role = discord.utils.get(interaction.guild.roles, id=target_role)
+                target_role = interaction.guild.get_role(target_role)
                 target_role_member_ids = (
-                    set(str(member.id) for member in target_role.members)
+                    {str(member.id) for member in target_role.members}
                     if target_role
-                    else {interaction.guild.members}
+                    else {str(member.id) for member in interaction.guild.members}
                 )
             else:
-                target_role_member_ids = set(member.id for member in interaction.guild.members)
+                # Voter keys are string IDs (JSON), so compare against string member IDs
+                target_role_member_ids = {str(member.id) for member in interaction.guild.members}
             logging.info(f"update percentage target role member ids: {target_role_member_ids}")
 
             unique_role_voters = unique_voters.intersection(target_role_member_ids)
@@ -389,8 +391,7 @@ class MoviePoll(Poll):
             logging.debug(f"Percentage voted text: {percentage_voted_text}")
 
             def update_string(message: str, voter_count: int, more_to_go: int, percentage_voted: float) -> str:
-                pattern = r"(<:fingercrossed:1103626715663712286> \d+ movie club passholder(s)? voted, \d+ more to go! \(\d+(\.\d+)?% participation\)\n\u200B)"
-                match = re.search(pattern, message)
+                match = PARTICIPATION_RE.search(message)
                 passholder_text = "passholder" if voter_count == 1 else "passholders"
                 new_string = f"<:fingercrossed:1103626715663712286> {voter_count} movie club {passholder_text} voted, {more_to_go} more to go! ({percentage_voted:.2f}% participation)\n\u200B"
                 if match:
@@ -3,8 +3,8 @@ import logging
 from collections import defaultdict
 from typing import Literal
 import asyncio
-import json
 from pathlib import Path
+from types import MappingProxyType
 
 # Third-party library imports
 import discord
@@ -16,16 +16,18 @@ from discord import app_commands
 from redbot.core import Config, commands
 from redbot.core.bot import Red
 
-from movieclub.api_handlers.movie_data_fetcher import get_movie_discord_embed
+from movieclub.api_handlers.movie_data_fetcher import (
+    close_movie_data_fetcher,
+    get_movie_data,
+    movie_data_to_discord_format,
+)
 
 # Local imports
 from movieclub.classes.date_poll import DatePoll
 from movieclub.classes.movie_poll import MoviePoll
+from utilities.config_utils import load_cog_strings
 from utilities.discord_utils import create_discord_thread
 
-# Initialize logging
-logging.basicConfig(level=logging.DEBUG)
-
 RequestType = Literal["discord_deleted_user", "owner", "user", "user_strict"]
 
 
@@ -41,11 +43,16 @@ class MovieClub(commands.Cog):
         self.keep_poll_alive.start()
         self.strings = self._load_strings()
 
-    def _load_strings(self) -> dict:
+    async def cog_unload(self):
+        self.keep_poll_alive.cancel()
+        for poll in self.active_polls.values():
+            if isinstance(poll, DatePoll):
+                poll.auto_close_if_due.cancel()
+        await close_movie_data_fetcher()
+
+    def _load_strings(self) -> MappingProxyType:
         """Load localized strings from JSON file."""
-        path = Path(__file__).parent / "strings.json"
-        with path.open(encoding="utf-8") as f:
-            return json.load(f)
+        return load_cog_strings(Path(__file__).parent)
 
     async def get_all_active_polls_from_config(self, guild):
         return await self.config.guild(guild).polls()
@@ -53,18 +60,24 @@ class MovieClub(commands.Cog):
     @tasks.loop(minutes=3)
     async def keep_poll_alive(self):
         error_polls = []
-        for poll in self.active_polls.values():
-            try:
-                await poll.keep_poll_alive()
-            except HTTPException as http_e:
-                message_id = await poll.get_message_id()
-                logging.exception(f"HTTPException while keeping poll {message_id} alive: {http_e}")
-                error_polls.append(poll.poll_id)
-            except Exception as e:
-                message_id = await poll.get_message_id()
-                logging.exception(f"Unable to keep poll {message_id} alive due to: {e!s}")
+        # Polls live in different messages/guilds, so refresh them concurrently; each task contains its own errors
+        async with asyncio.TaskGroup() as tg:
+            for poll in list(self.active_polls.values()):
+                tg.create_task(self._keep_single_poll_alive(poll, error_polls))
         for error_poll in error_polls:
-            del self.active_polls[error_poll]
+            self.active_polls.pop(error_poll, None)
+
+    async def _keep_single_poll_alive(self, poll, error_polls: list) -> None:
+        # Nothing here may raise: a failing task would cancel its sibling refreshes and stop the loop.
+        # Log poll_id rather than awaiting the message id, which could fail just like the refresh did.
+        try:
+            await poll.keep_poll_alive()
+        except HTTPException as http_e:
+            logging.exception(f"HTTPException while keeping poll {poll.poll_id} alive: {http_e}")
+            error_polls.append(poll.poll_id)
+        except Exception as e:
+            # Unlike a rejected message edit, other errors may be transient, so the poll is kept for the next run
+            logging.exception(f"Unable to keep poll {poll.poll_id} alive due to: {e!s}")
 
     @keep_poll_alive.before_loop
     async def before_refresh_buttons(self):
@@ -75,8 +88,13 @@ class MovieClub(commands.Cog):
 
     @commands.Cog.listener()
     async def on_ready(self):
-        for guild in self.bot.guilds:
-            restoring_polls = await self.get_all_active_polls_from_config(guild)
+        # One read of every guild's stored data, then visit only the guilds that actually have polls
+        all_guilds = await self.config.all_guilds()
+        for guild_id, guild_data in all_guilds.items():
+            restoring_polls = guild_data.get("polls")
+            guild = self.bot.get_guild(guild_id)
+            if not restoring_polls or guild is None:
+                continue
             for poll_id in restoring_polls.keys():
                 if poll_id == "date_poll":
                     self.active_polls[poll_id] = DatePoll(self.bot, self.config, guild)
@@ -161,16 +179,14 @@ class MovieClub(commands.Cog):
         if not date_user_votes:
             await ctx.send("No votes have been cast yet.")
             return
-        
-        lines = []
-        for date_str, user_dict in date_user_votes.items():
-            user_ids = ", ".join(f"<@{u}>" for u in user_dict.keys())
-            lines.append(f"**{date_str}**: {user_ids}")
-        
-        if lines:
-            await ctx.send("\n".join(lines))
-        else:
-            await ctx.send("No votes found.")
+
+        # date_user_votes is non-empty here, so every date produces a line and there is nothing left to check
+        await ctx.send(
+            "\n".join(
+                f"**{date_str}**: {', '.join(f'<@{u}>' for u in user_dict)}"
+                for date_str, user_dict in date_user_votes.items()
+            )
+        )
 
     # !movieclub poll movie start
     # !movieclub poll movie end
@@ -226,22 +242,14 @@ class MovieClub(commands.Cog):
         if not user_votes:
             await ctx.send("No votes have been cast yet.")
             return
-        
-        # Build reverse map: {movie: [voters...]}
-        from collections import defaultdict
+
+        # Build reverse map: {movie: [voter mentions...]}, formatting each mention as it is grouped
         movie_to_voters = defaultdict(list)
         for uid, movie_name in user_votes.items():
-            movie_to_voters[movie_name].append(uid)
-        
-        results = []
-        for mv, voters in movie_to_voters.items():
-            mention_str = ", ".join(f"<@{u}>" for u in voters)
-            results.append(f"**{mv}**: {mention_str}")
-        
-        if not results:
-            await ctx.send("No votes found.")
-        else:
-            await ctx.send("\n".join(results))
+            movie_to_voters[movie_name].append(f"<@{uid}>")
+
+        # user_votes is non-empty here, so there is always at least one line to send
+        await ctx.send("\n".join(f"**{mv}**: {', '.join(voters)}" for mv, voters in movie_to_voters.items()))
 
     @commands.guild_only()
     @commands.bot_has_permissions(embed_links=True)
@@ -267,13 +275,15 @@ class MovieClub(commands.Cog):
         if movie_name:
             logging.debug(f"Adding movie {movie_name} to the poll")
             stored_movies = defaultdict(dict, await self.config.guild(ctx.guild).movies())
-            movie_data, discord_format = get_movie_discord_embed(movie_name)
+            movie_data = await get_movie_data(movie_name) or {}
             movie_title = movie_data.get("title", movie_name)
-            if movie_title not in stored_movies:
+            if movie_data and movie_title not in stored_movies:
                 stored_movies[movie_title] = movie_data
                 await self.config.guild(ctx.guild).movies.set(stored_movies)
-                await ctx.send(embed=discord_format)
-                await ctx.send(f"'{movie_title}' has been added to the movie poll.")
+                # The embed is only built once the movie is actually added
+                discord_format = movie_data_to_discord_format(movie_data)
+                # Confirmation and movie card in one message: one API round trip instead of two
+                await ctx.send(f"'{movie_title}' has been added to the movie poll.", embed=discord_format)
             else:
                 await ctx.send(f"There was an error adding '{movie_name}' to the movie poll.")
         else:
@@ -289,7 +299,11 @@ class MovieClub(commands.Cog):
         logging.debug(f"movie thread command received with movie_name={movie_name}")
         if movie_name:
             logging.debug(f"Creating thread for movie {movie_name}")
-            movie_data, discord_format = get_movie_discord_embed(movie_name)
+            # The thread is plain text, so skip building an embed that would go unused
+            movie_data = await get_movie_data(movie_name)
+            if not movie_data:
+                await ctx.send(f"Couldn't find details for '{movie_name}'.")
+                return None
             logging.debug(f"movie_data: {movie_data}")
             movie_name = movie_data.get("title", movie_name)
             logging.debug(f"movie_name: {movie_name}")
@@ -2,7 +2,6 @@ import json
 import logging
 import os
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +14,6 @@ from redbot.core.bot import Red
 
 from .dialogs import DialogManager
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 IDENTIFIER = int(os.getenv("IDENTIFIER", "1234567890"))
@@ -1,4 +1,13 @@
+import asyncio
+import calendar
+import copy
+import functools
 import logging
+import sys
+from array import array
+from collections import defaultdict
+from datetime import date
+from operator import itemgetter
 
 import discord
 
@@ -6,19 +15,66 @@ from utilities.date_utils import DateUtil
 
 from .role_management import RoleManager
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_month_day(date_str: str) -> tuple[int, int]:
+    """Split a stored "MM-DD" holiday date into (month, day) ints, once per distinct string."""
+    month, _, day = date_str.partition("-")
+    return int(month), int(day)
+
+
+def _holiday_date(year: int, month: int, day: int) -> date:
+    """The holiday's date in a given year, clamped to the month's last day (Feb 29 falls on Feb 28 off leap years)."""
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def _intern_holidays(holidays: dict) -> dict:
+    """
+    Intern holiday names and their date/color strings before caching.
+
+    Guilds mostly share the default holidays, so cached copies then point at one string per name, date and color,
+    so the per-guild prepared arrays built from them share those strings.
+    """
+    interned = {}
+    for name, details in holidays.items():
+        interned_details = dict(details)
+        for field in ("date", "color"):
+            if isinstance(interned_details.get(field), str):
+                interned_details[field] = sys.intern(interned_details[field])
+        interned[sys.intern(name)] = interned_details
+    return interned
+
+
 class HolidayService:
     def __init__(self, config):
         self.config = config
         self.role_manager = RoleManager(self.config)
+        # Holiday configs keyed by guild ID, filled on first read and replaced on every write through this service
+        self._holidays_cache: dict[int, dict] = {}
+        # Serialises read-modify-write of a guild's holidays so concurrent admin edits can't drop each other
+        self._holiday_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Per guild ID: holidays flattened into parallel (names, MMDD ints) arrays
+        self._prepared_cache: dict[int, tuple[tuple[str, ...], array]] = {}
+        # Per guild ID: (year, day ordinals, indexes into names ordered by date) for that year,
+        # so a lookup is a single subtraction pass and listing never re-sorts
+        self._ordinals_cache: dict[int, tuple[int, array, list[int]]] = {}
+        # Case-insensitive name lookups keyed by guild ID
+        self._name_index_cache: dict[int, dict[str, str]] = {}
+
+    def _invalidate_derived(self, guild_id: int) -> None:
+        """Drop everything built from a guild's holidays; call whenever its cached holidays change."""
+        self._prepared_cache.pop(guild_id, None)
+        self._ordinals_cache.pop(guild_id, None)
+        self._name_index_cache.pop(guild_id, None)
 
     async def get_holidays(self, guild):
         """
         Retrieve the holiday configurations for the specified guild.
 
+        The result is cached per guild and shared between callers, so treat it as read-only.
+
         Args:
         ----
             guild (discord.Guild): The guild from which to retrieve holiday configurations.
@@ -28,93 +84,158 @@ class HolidayService:
             dict: A dictionary containing the holiday configurations.
 
         """
+        cached = self._holidays_cache.get(guild.id)
+        if cached is not None:
+            return cached
         try:
-            holidays = await self.config.guild(guild).holidays()
+            holidays = _intern_holidays(await self.config.guild(guild).holidays())
+            self._holidays_cache[guild.id] = holidays
+            self._invalidate_derived(guild.id)
             return holidays
         except Exception as e:
             logger.error(f"Failed to retrieve holidays for guild {guild.name}: {e!s}")
             return {}
 
-    async def add_holiday(self, guild, name, date, color, image=None, banner_url=None):
-        holidays = await self.config.guild(guild).holidays()
-        if holidays.get(name):
-            return False, f"Holiday {name} already exists!"
-
-        holidays[name] = {"date": date, "color": color}
-        if image:
-            holidays[name]["image"] = image
-        if banner_url:
-            holidays[name]["banner"] = banner_url
+    async def _holidays_for_update(self, guild):
+        """Return a private copy of the guild's holidays to mutate; callers hold the guild's write lock."""
+        cached = self._holidays_cache.get(guild.id)
+        if cached is None:
+            return await self.config.guild(guild).holidays()
+        return copy.deepcopy(cached)
 
+    async def _save_holidays(self, guild, holidays):
         await self.config.guild(guild).holidays.set(holidays)
+        self._holidays_cache[guild.id] = _intern_holidays(holidays)
+        self._invalidate_derived(guild.id)
+
+    async def add_holiday(self, guild, name, date, color, image=None, banner_url=None):
+        async with self._holiday_locks[guild.id]:
+            holidays = await self._holidays_for_update(guild)
+            if holidays.get(name):
+                return False, f"Holiday {name} already exists!"
+
+            holidays[name] = {"date": date, "color": color}
+            if image:
+                holidays[name]["image"] = image
+            if banner_url:
+                holidays[name]["banner"] = banner_url
+
+            await self._save_holidays(guild, holidays)
         return True, f"Holiday {name} added successfully!"
 
     async def remove_holiday(self, guild, name):
-        holidays = await self.config.guild(guild).holidays()
-        if not holidays.get(name):
-            return False, f"Holiday {name} does not exist!"
+        async with self._holiday_locks[guild.id]:
+            holidays = await self._holidays_for_update(guild)
+            if not holidays.get(name):
+                return False, f"Holiday {name} does not exist!"
 
-        del holidays[name]
-        await self.config.guild(guild).holidays.set(holidays)
+            del holidays[name]
+            await self._save_holidays(guild, holidays)
         return True, f"Holiday {name} has been removed successfully!"
 
     async def edit_holiday(self, guild, name, new_date, new_color, new_image=None, new_banner_url=None):
-        holidays = await self.config.guild(guild).holidays()
-        if not holidays.get(name):
-            return False, f"Holiday {name} does not exist!"
-
-        # Update the holiday details
-        holidays[name]["date"] = new_date
-        holidays[name]["color"] = new_color
-        if new_image:
-            holidays[name]["image"] = new_image
-        if new_banner_url:
-            holidays[name]["banner"] = new_banner_url
-
-        await self.config.guild(guild).holidays.set(holidays)
+        async with self._holiday_locks[guild.id]:
+            holidays = await self._holidays_for_update(guild)
+            if not holidays.get(name):
+                return False, f"Holiday {name} does not exist!"
+
+            # Update the holiday details
+            holidays[name]["date"] = new_date
+            holidays[name]["color"] = new_color
+            if new_image:
+                holidays[name]["image"] = new_image
+            if new_banner_url:
+                holidays[name]["banner"] = new_banner_url
+
+            await self._save_holidays(guild, holidays)
         return True, f"Holiday {name} has been updated successfully!"
 
     async def get_sorted_holidays(self, guild):
-        holidays = await self.config.guild(guild).holidays()
+        holidays = await self.get_holidays(guild)
         if not holidays:
             return None, "No holidays have been configured."
 
-        upcoming_holiday, days_until = self.find_upcoming_holiday(holidays)
-        future_holidays = {name: days for name, days in days_until.items() if days > 0}
-        past_holidays = {name: days for name, days in days_until.items() if days <= 0}
+        return self.sort_holidays(guild, holidays)
 
-        sorted_future_holidays = sorted(future_holidays.items(), key=lambda x: x[1])
-        sorted_past_holidays = sorted(past_holidays.items(), key=lambda x: x[1], reverse=False)
-
-        sorted_holidays = sorted_future_holidays + sorted_past_holidays
+    def sort_holidays(self, guild, holidays):
+        """Order the guild's already-loaded holidays: future ones soonest first, then past ones."""
+        upcoming_holiday, days_until = self.find_upcoming_holiday(guild, holidays)
+        # The year's date order is precomputed, so this is a rotation at today rather than a sort
+        by_date = self.holidays_by_date(guild, holidays, days_until)
+        split = next((k for k, (_, days) in enumerate(by_date) if days > 0), len(by_date))
+        sorted_holidays = by_date[split:] + by_date[:split]
         return sorted_holidays, upcoming_holiday, days_until
 
-    def find_upcoming_holiday(self, holidays):
-        # Logic to find the upcoming holiday
-        current_date = DateUtil.now()
-        upcoming_holiday = None
-        min_days_diff = float("inf")
-        days_until = {}
+    def holidays_by_date(self, guild, holidays, days_until):
+        """
+        (name, days until) pairs in calendar order, earliest first.
 
-        for name, details in holidays.items():
-            holiday_date_str = f"{current_date.year}-{details['date']}"
-            holiday_date = DateUtil.str_to_date(holiday_date_str, "%Y-%m-%d")
+        Pass the days_until that find_upcoming_holiday returned for the same holidays.
+        """
+        names, _, order = self._ordinals_for_year(guild, holidays, DateUtil.now().year)
+        return [(names[i], days_until[names[i]]) for i in order]
+
+    def _prepare_holidays(self, guild, holidays):
+        """Return the guild's holidays as parallel (names, MMDD ints) arrays, built once per cached holidays dict."""
+        prepared = self._prepared_cache.get(guild.id)
+        if prepared is None:
+            names = tuple(holidays)
+            month_days = (_parse_month_day(details["date"]) for details in holidays.values())
+            prepared = self._prepared_cache[guild.id] = (
+                names,
+                array("i", (month * 100 + day for month, day in month_days)),
+            )
+        return prepared
+
+    def _ordinals_for_year(self, guild, holidays, year):
+        """
+        Return (names, ordinals, date order) for the guild's holidays in the given year.
 
-            days_diff = (holiday_date - current_date).days
-            days_until[name] = days_diff
+        They are rebuilt only when the guild's holidays or the year change, and always come from the same build.
+        """
+        names, month_days = self._prepare_holidays(guild, holidays)
+        cached = self._ordinals_cache.get(guild.id)
+        if cached is None or cached[0] != year:
+            ordinals = array("i", (_holiday_date(year, md // 100, md % 100).toordinal() for md in month_days))
+            order = sorted(range(len(ordinals)), key=ordinals.__getitem__)
+            cached = self._ordinals_cache[guild.id] = (year, ordinals, order)
+        _, ordinals, order = cached
+        return names, ordinals, order
+
+    def holidays_on(self, holidays, day):
+        """Names of the holidays that fall on the given day, using the same Feb 29 clamping as days_until."""
+        return [
+            name
+            for name, details in holidays.items()
+            if _holiday_date(day.year, *_parse_month_day(details["date"])) == day
+        ]
+
+    def find_upcoming_holiday(self, guild, holidays):
+        current_date = DateUtil.now()
+        today_ordinal = current_date.toordinal()
 
-            if days_diff > 0 and days_diff < min_days_diff:
-                min_days_diff = days_diff
-                upcoming_holiday = name
+        names, ordinals, _ = self._ordinals_for_year(guild, holidays, current_date.year)
+        days_until = dict(zip(names, [ordinal - today_ordinal for ordinal in ordinals], strict=True))
 
+        # min() keeps the first of equal candidates, matching the old strict "<" scan on ties
+        future = [(name, days) for name, days in days_until.items() if days > 0]
+        upcoming_holiday = min(future, key=itemgetter(1))[0] if future else None
         return upcoming_holiday, days_until
 
-    async def validate_holiday_exists(self, holidays, holiday_name):
+    def holiday_name_index(self, guild, holidays):
+        """Lower-cased name -> stored name for the guild's holidays, built once per cached holidays dict."""
+        name_index = self._name_index_cache.get(guild.id)
+        if name_index is None:
+            name_index = self._name_index_cache[guild.id] = {name.lower(): name for name in holidays}
+        return name_index
+
+    async def validate_holiday_exists(self, guild, holidays, holiday_name):
         """
         Check if the holiday exists in the given dictionary of holidays.
 
         Args:
         ----
+            guild (discord.Guild): The guild the holidays belong to.
             holidays (dict): A dictionary of holidays.
             holiday_name (str): The name of the holiday to check.
 
@@ -123,8 +244,7 @@ class HolidayService:
             tuple: (bool, str) indicating if the holiday exists and an optional message.
 
         """
-        normalized_holidays = {name.lower(): details for name, details in holidays.items()}
-        if holiday_name.lower() in normalized_holidays:
+        if holiday_name.lower() in self.holiday_name_index(guild, holidays):
             logger.debug(f"Holiday '{holiday_name}' found.")
             return True, None
         else:
@@ -150,12 +270,13 @@ class HolidayService:
         )
 
         try:
-            holidays = await self.config.guild(guild).holidays()
+            holidays = await self.get_holidays(guild)
+            roles_by_name = self.role_manager.roles_by_name(guild)
             roles_removed = []
             for holiday_name, details in holidays.items():
                 if holiday_name.lower() != current_holiday_name.lower():
                     formatted_role_name = f"{holiday_name} {details['date']}"
-                    role = discord.utils.get(guild.roles, name=formatted_role_name)
+                    role = roles_by_name.get(formatted_role_name)
                     if role:
                         await self.role_manager.delete_role_from_guild(guild, role)
                         roles_removed.append(role.name)
@@ -219,6 +340,9 @@ class HolidayService:
                     holiday_details["date"],
                     holiday_details.get("image"),
                 )
+            # The context manager above writes the holidays back, so drop the cached copy
+            self._holidays_cache.pop(guild.id, None)
+            self._invalidate_derived(guild.id)
             if role:
                 await self.role_manager.assign_role_to_all_members(guild, role)
                 await self.role_manager.move_role_to_top_priority(guild, role)
@@ -1,16 +1,34 @@
+import functools
 import logging
 import os
 
 import discord
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def parse_hex_color(color: str) -> int:
+    """Convert a stored "#RRGGBB" holiday color to its int value, once per distinct string."""
+    return int(color.removeprefix("#"), 16)
+
+
 class RoleManager:
     def __init__(self, config):
         self.config = config
 
+    @staticmethod
+    def roles_by_name(guild: discord.Guild) -> dict[str, discord.Role]:
+        """
+        Maps role names to roles in one pass, for callers that look up several roles by name.
+
+        Like discord.utils.get, the lowest role wins when names are duplicated.
+        """
+        roles = {}
+        for role in guild.roles:
+            roles.setdefault(role.name, role)
+        return roles
+
     async def create_or_update_role(
         self, guild: discord.Guild, name: str, color: str, date: str, image: str | None = None
     ) -> discord.Role:
@@ -18,7 +36,7 @@ class RoleManager:
         Creates a new role or updates an existing one with the given attributes.
         """
         name_with_date = f"{name} {date}"
-        role_args = {"color": discord.Color(int(color[1:], 16))}
+        role_args = {"color": discord.Color(parse_hex_color(color))}
         existing_role = next((role for role in guild.roles if role.name.startswith(name)), None)
 
         # Handle image if provided and guild supports role icons
@@ -65,7 +83,8 @@ class RoleManager:
                 f"Would have applied role to {len(guild.members)} members in {guild.name} if not in dry run mode"
             )
         else:
-            opt_in_users = await self.config.guild(guild).opt_in_users()
+            # Config stores a list; a set keeps the per-member check O(1) on large guilds
+            opt_in_users = set(await self.config.guild(guild).opt_in_users())
 
             for member in guild.members:
                 if member.id in opt_in_users:
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import os
 import re
+from collections import defaultdict
 from datetime import datetime
 
 import discord
@@ -12,12 +14,17 @@ from utilities.discord_utils import fetch_and_save_guild_banner
 from utilities.image_utils import get_image_handler
 
 from .holiday_management import HolidayService
-from .role_management import RoleManager
+from .role_management import RoleManager, parse_hex_color
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 IDENTIFIER = int(os.getenv("IDENTIFIER", "1234567890"))
 GUILD_ID = int(os.getenv("GUILD_ID", "947277446678470696"))
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord's per-message embed limit
+HOLIDAY_DATE_RE = re.compile(r"\d{2}-\d{2}")
+OPT_IN_FLUSH_DELAY_SECONDS = 2.0  # Joins arriving within this window share one Config write and holiday check
+ALL_MEMBERS_SYNONYMS = frozenset({"everyone", "all", "everybody"})
+DRY_RUN_ENABLED_MODES = frozenset({"enabled", "true", "on"})
+DRY_RUN_DISABLED_MODES = frozenset({"disabled", "false", "off"})
 image_path = os.path.abspath(os.path.join("assets", "your-image.png"))
 logger.debug(f"Absolute image path: {image_path}")
 
@@ -93,6 +100,9 @@ class SeasonalRoles(commands.Cog):
         self.config.register_guild(**default_guild)
         self.holiday_service = HolidayService(self.config)
         self.role_manager = RoleManager(self.config)
+        # Members who joined since the last opt-in flush, per guild
+        self._pending_opt_ins: defaultdict[int, set[int]] = defaultdict(set)
+        self._opt_in_flush_tasks: dict[int, asyncio.Task] = {}
 
         logger.info("Seasonal roles cog initialized")
 
@@ -107,8 +117,16 @@ class SeasonalRoles(commands.Cog):
             logger.debug("check_holidays loop is already running")
         logger.info("Seasonal roles cog ready")
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.check_holidays.cancel()
+        for flush_task in self._opt_in_flush_tasks.values():
+            flush_task.cancel()
+        self._opt_in_flush_tasks.clear()
+        # Save joins still waiting on a cancelled flush so a reload doesn't drop them
+        pending_opt_ins = list(self._pending_opt_ins.items())
+        self._pending_opt_ins.clear()
+        for guild_id, joined in pending_opt_ins:
+            await self._save_opt_ins(guild_id, joined)
 
     @commands.group(aliases=["seasonalroles", "sroles", "sr"])
     async def seasonal(self, ctx):
@@ -136,7 +154,7 @@ class SeasonalRoles(commands.Cog):
     @member.command(name="remove")
     async def member_remove(self, ctx, member: discord.Member | None, *, all_members: str = None):
         """Removes a member or all members from the opt-in list."""
-        if all_members and all_members.lower() in {"everyone", "all", "everybody"}:
+        if all_members and all_members.lower() in ALL_MEMBERS_SYNONYMS:
             await self.config.guild(ctx.guild).opt_in_users.set([])
             await ctx.send("All members have been removed from the opt-in list.")
         elif member:
@@ -153,9 +171,7 @@ class SeasonalRoles(commands.Cog):
     @member.command(name="config")
     async def member_config(self, ctx, config_type: str):
         """Configures the opt-in list based on the given type: 'everyone' or a role name."""
-        all_members_synonyms = {"everyone", "all", "everybody"}
-
-        if config_type.lower() in all_members_synonyms:
+        if config_type.lower() in ALL_MEMBERS_SYNONYMS:
             members = [member.id for member in ctx.guild.members if not member.bot]
             await ctx.send(f"Adding everyone to {self.qualified_name}...")
         else:
@@ -206,9 +222,15 @@ class SeasonalRoles(commands.Cog):
         if not color or not color.startswith("#") or len(color) != 7:
             await ctx.send("Please provide a valid hex color code.")
             return False
+        # Parse here rather than only checking the shape; the cached result is reused when the role is created
+        try:
+            parse_hex_color(color)
+        except ValueError:
+            await ctx.send("Please provide a valid hex color code.")
+            return False
 
         # Add check for if format of date is weird
-        if not date or not re.match(r"\d{2}-\d{2}", date):
+        if not date or not HOLIDAY_DATE_RE.match(date):
             await ctx.send("Please provide a valid date.")
             return False
         return True
@@ -265,26 +287,30 @@ class SeasonalRoles(commands.Cog):
         """Lists all configured holidays along with their details."""
         try:
             logging.info(f"Holiday service looks like: {self.holiday_service}")
-            sorted_holidays, upcoming_holiday, days_until = await self.holiday_service.get_sorted_holidays(ctx.guild)
-            if not sorted_holidays:
+            # Read the holidays once and reuse them for both sorting and the embed details
+            holidays = await self.holiday_service.get_holidays(ctx.guild)
+            if not holidays:
                 await ctx.send("No holidays have been configured.")
                 return
+            sorted_holidays, upcoming_holiday, days_until = self.holiday_service.sort_holidays(ctx.guild, holidays)
 
             embeds = []
             for name, _ in sorted_holidays:
-                details = await self.config.guild(ctx.guild).holidays.get_raw(name)
-                color = int(details["color"].replace("#", ""), 16)
-                description = details["date"]
+                details = holidays[name]
+                days = days_until[name]
                 if name == upcoming_holiday:
-                    description += " - Upcoming in " + str(days_until[name]) + " days"
-                elif days_until[name] <= 0:
-                    description += " - Passed " + str(-days_until[name]) + " days ago"
-                embed = discord.Embed(description=description, color=color)
+                    description = f"{details['date']} - Upcoming in {days} days"
+                elif days <= 0:
+                    description = f"{details['date']} - Passed {-days} days ago"
+                else:
+                    description = details["date"]
+                embed = discord.Embed(description=description, color=parse_hex_color(details["color"]))
                 embed.set_author(name=name)
                 embeds.append(embed)
 
-            for embed in embeds:
-                await ctx.send(embed=embed)
+            # One message per batch of embeds rather than one round trip per holiday
+            for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+                await ctx.send(embeds=embeds[start : start + MAX_EMBEDS_PER_MESSAGE])
 
         except Exception as e:
             await ctx.send("An error occurred while listing holidays. Please try again later.")
@@ -319,9 +345,9 @@ class SeasonalRoles(commands.Cog):
         """Toggle dry run mode for seasonal role actions."""
         logger.info("toggle_dry_run command invoked")
         mode = mode.lower()
-        if mode in ["enabled", "true", "on"]:
+        if mode in DRY_RUN_ENABLED_MODES:
             enabled = True
-        elif mode in ["disabled", "false", "off"]:
+        elif mode in DRY_RUN_DISABLED_MODES:
             enabled = False
         else:
             await ctx.send(
@@ -345,31 +371,26 @@ class SeasonalRoles(commands.Cog):
     async def toggle_seasonal_role(self, ctx: commands.Context) -> None:
         """Toggle opting in/out from the seasonal role."""
         opt_out_users = await self.config.guild(ctx.guild).opt_out_users()
+        # Both branches check the same day, so take "today" once per command
+        current_date = datetime.now().date()
+        # Check if there's a current holiday and if the member has its role.
+        holidays = await self.holiday_service.get_holidays(ctx.guild)
+        roles_by_name = RoleManager.roles_by_name(ctx.guild)
+        current_roles = [
+            role
+            for holiday in self.holiday_service.holidays_on(holidays, current_date)
+            if (role := roles_by_name.get(holiday)) and role in ctx.author.roles
+        ]
 
         if ctx.author.id in opt_out_users:
             opt_out_users.remove(ctx.author.id)
-            # Check if there's a current holiday and if the member has its role.
-            current_date = datetime.now().date()
-            holidays = await self.config.guild(ctx.guild).holidays()
-            for holiday, details in holidays.items():
-                holiday_date = datetime.strptime(details["date"], "%m-%d").date().replace(year=current_date.year)
-                if current_date == holiday_date:
-                    role = discord.utils.get(ctx.guild.roles, name=holiday)
-                    if role and role in ctx.author.roles:
-                        await ctx.author.add_roles(role)
+            for role in current_roles:
+                await ctx.author.add_roles(role)
             await ctx.respond("You have opted in to the seasonal role.")
         else:
             opt_out_users.append(ctx.author.id)
-
-            # Check if there's a current holiday and if the member has its role.
-            current_date = datetime.now().date()
-            holidays = await self.config.guild(ctx.guild).holidays()
-            for holiday, details in holidays.items():
-                holiday_date = datetime.strptime(details["date"], "%m-%d").date().replace(year=current_date.year)
-                if current_date == holiday_date:
-                    role = discord.utils.get(ctx.guild.roles, name=holiday)
-                    if role and role in ctx.author.roles:
-                        await ctx.author.remove_roles(role)
+            for role in current_roles:
+                await ctx.author.remove_roles(role)
             await ctx.respond("You have opted out from the seasonal role.")
 
         await self.config.guild(ctx.guild).opt_out_users.set(opt_out_users)
@@ -391,7 +412,7 @@ class SeasonalRoles(commands.Cog):
             logger.debug("No guild provided, using default guild.")
 
         try:
-            holidays = await self.config.guild(guild).holidays()
+            holidays = await self.holiday_service.get_holidays(guild)
             if not holidays:
                 logger.warning("No holidays configured for this guild.")
                 return
@@ -400,20 +421,16 @@ class SeasonalRoles(commands.Cog):
             logger.error(f"Failed to retrieve holidays from config: {e}")
             return
 
-        current_date = datetime.now().date()
-        logger.debug(f"Current date: {current_date}")
+        # Days from today to each holiday this year, computed once instead of re-parsing dates in the loop
+        _, days_until = self.holiday_service.find_upcoming_holiday(guild, holidays)
 
-        # Sort holidays by date to manage overlapping or back-to-back holidays
-        sorted_holidays = sorted(
-            holidays.items(), key=lambda x: datetime.strptime(f"{current_date.year}-{x[1]['date']}", "%Y-%m-%d").date()
-        )
+        # Walk holidays in date order to manage overlapping or back-to-back holidays
+        sorted_holidays = self.holiday_service.holidays_by_date(guild, holidays, days_until)
         logger.debug(f"Sorted holidays: {sorted_holidays}")
         banner_config = await self.config.guild(guild).banner_management()
-        all_roles = guild.roles
-        for i, (holiday_name, details) in enumerate(sorted_holidays):
-            holiday_date_str = details["date"]
-            holiday_date = datetime.strptime(f"{current_date.year}-{holiday_date_str}", "%Y-%m-%d").date()
-            days_until_holiday = (holiday_date - current_date).days
+        roles_by_name = self.role_manager.roles_by_name(guild)
+        for i, (holiday_name, days_until_holiday) in enumerate(sorted_holidays):
+            details = holidays[holiday_name]
             logger.debug(f"Holiday '{holiday_name}' is {days_until_holiday} days away.")
 
             # Notify about upcoming holidays
@@ -434,7 +451,7 @@ class SeasonalRoles(commands.Cog):
                 logger.debug(f"Handling past or far future holiday: {holiday_name}")
                 # TODO: Dry this out
                 role_name = f"{holiday_name} {details['date']}"
-                role = discord.utils.get(all_roles, name=role_name)
+                role = roles_by_name.get(role_name)
                 logger.debug(f"role: {role}")
                 if role:
                     await self.role_manager.delete_role_from_guild(guild, role)
@@ -474,7 +491,7 @@ class SeasonalRoles(commands.Cog):
     async def force_holiday(self, ctx: commands.Context, *holiday_name_parts: str) -> None:
         holiday_name = " ".join(holiday_name_parts).lower()
         guild = ctx.guild
-        holidays = await self.config.guild(guild).holidays()
+        holidays = await self.holiday_service.get_holidays(guild)
         dry_run_mode = await self.config.guild(guild).dry_run_mode()
 
         logger.debug(f"Processing forceholiday for '{holiday_name}' with dry run mode set to {dry_run_mode}.")
@@ -494,8 +511,8 @@ class SeasonalRoles(commands.Cog):
 
         # Apply the holiday banner
         # Ensure holiday names are accessed in a case-insensitive manner
-        holidays_lower = {key.lower(): value for key, value in holidays.items()}
-        holiday_details = holidays_lower.get(holiday_name)
+        stored_name = self.holiday_service.holiday_name_index(guild, holidays).get(holiday_name)
+        holiday_details = holidays[stored_name] if stored_name else None
 
         if holiday_details:
             logger.debug(f"Found holiday details for '{holiday_name}': {holiday_details}")
@@ -513,7 +530,7 @@ class SeasonalRoles(commands.Cog):
             await ctx.send(f"No details found for the holiday '{holiday_name}'.")
             logger.error(f"No details found for the holiday '{holiday_name}'.")
 
-        exists, message = await self.holiday_service.validate_holiday_exists(holidays, holiday_name)
+        exists, message = await self.holiday_service.validate_holiday_exists(guild, holidays, holiday_name)
         if not exists:
             logger.error(f"Failed to find holiday: {message}")
             await ctx.send(message or "An error occurred.")
@@ -607,12 +624,33 @@ class SeasonalRoles(commands.Cog):
         if member.bot:
             return  # Skip bots
 
-        opt_in_users = await self.config.guild(member.guild).opt_in_users()
+        # Buffer the join; a burst of joins is written to the opt-in list in one go
+        guild = member.guild
+        self._pending_opt_ins[guild.id].add(member.id)
+        flush_task = self._opt_in_flush_tasks.get(guild.id)
+        if flush_task is None or flush_task.done():
+            self._opt_in_flush_tasks[guild.id] = asyncio.create_task(self._flush_opt_ins_later(guild))
+
+    async def _flush_opt_ins_later(self, guild: discord.Guild):
+        await asyncio.sleep(OPT_IN_FLUSH_DELAY_SECONDS)
+        # Unregister before awaiting anything, so joins during the write below schedule a flush of their own
+        self._opt_in_flush_tasks.pop(guild.id, None)
+        joined = self._pending_opt_ins.pop(guild.id, set())
+        if not joined:
+            return
 
-        if member.id not in opt_in_users:
-            opt_in_users.append(member.id)
-            await self.config.guild(member.guild).opt_in_users.set(opt_in_users)
-            logger.info(f"Added {member.display_name} to opt-in users.")
+        await self._save_opt_ins(guild.id, joined)
+
+        # Check and assign holiday roles using the existing method, once for the whole batch
+        await self.check_holidays(guild, force=True)
+
+    async def _save_opt_ins(self, guild_id: int, joined: set[int]):
+        if not joined:
+            return
 
-        # Check and assign holiday roles using the existing method
-        await self.check_holidays(member.guild, force=True)
+        async with self.config.guild_from_id(guild_id).opt_in_users() as opt_in_users:
+            already_opted_in = set(opt_in_users)
+            new_opt_ins = [member_id for member_id in joined if member_id not in already_opted_in]
+            opt_in_users.extend(new_opt_ins)
+        if new_opt_ins:
+            logger.info(f"Added {len(new_opt_ins)} new members to opt-in users.")
@@ -18,11 +18,12 @@ class AdminManager(commands.Cog):
         self.journal_manager = journal_manager
 
     async def show_settings(self, ctx):
-        base_s_link = await self.config.base_s_link()
-        level_exponent = await self.config.level_exponent()
-        max_levels = await self.config.max_levels()
-        decay_rate = await self.config.decay_rate()
-        decay_interval = await self.config.decay_interval()
+        settings = await self.config.all()
+        base_s_link = settings["base_s_link"]
+        level_exponent = settings["level_exponent"]
+        max_levels = settings["max_levels"]
+        decay_rate = settings["decay_rate"]
+        decay_interval = settings["decay_interval"]
         events_config = await self.config.guild(ctx.guild).all()
 
         levels_points = []
@@ -34,7 +35,7 @@ class AdminManager(commands.Cog):
 
         # event_points = "\n".join([f"- {event}: {details['points']} points" for event, details in events_config.items()])
 
-        levels_points_str = "\n".join([f"- Level {level}: {points} points" for level, points in levels_points])
+        levels_points_str = "\n".join(f"- Level {level}: {points} points" for level, points in levels_points)
 
         settings_message = (
             f"# Social Link settings:\n"
@@ -69,23 +70,22 @@ class AdminManager(commands.Cog):
             for other_user_id, other_user_data in all_users.items():
                 if user_id in other_user_data.get("scores", {}):
                     try:
-                        # Remove the confidant score
-                        del other_user_data["scores"][user_id]
-                        logger.info("Removed confidant score for user %s from other user %s", user_id, other_user_id)
-
-                        # Recalculate the aggregate score
-                        other_user_data["aggregate_score"] = sum(other_user_data["scores"].values())
-                        logger.info(
-                            "Recalculated aggregate score for user %s: %s",
-                            other_user_id,
-                            other_user_data["aggregate_score"],
-                        )
+                        # Re-read inside the write so only scores and aggregate_score change, in one Config write
+                        async with self.config.user_from_id(other_user_id).all() as fresh_user_data:
+                            # Remove the confidant score
+                            fresh_user_data["scores"].pop(user_id, None)
+                            logger.info(
+                                "Removed confidant score for user %s from other user %s", user_id, other_user_id
+                            )
+
+                            # Recalculate the aggregate score
+                            fresh_user_data["aggregate_score"] = sum(fresh_user_data["scores"].values())
+                            logger.info(
+                                "Recalculated aggregate score for user %s: %s",
+                                other_user_id,
+                                fresh_user_data["aggregate_score"],
+                            )
 
-                        # Save the updated data
-                        await self.config.user_from_id(other_user_id).set_raw("scores", value=other_user_data["scores"])
-                        await self.config.user_from_id(other_user_id).set_raw(
-                            "aggregate_score", value=other_user_data["aggregate_score"]
-                        )
                         logger.info(f"Updated scores and aggregate score for user {other_user_id}")
                     except Exception as e:
                         logger.exception(
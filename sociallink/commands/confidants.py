@@ -65,22 +65,25 @@ class ConfidantsManager:
         user_data = await self.config.user(ctx.author).all()
 
         if not user_data.get("scores"):
-            message = await ctx.send("_No confidants found. Seek out allies to forge unbreakable bonds._")
+            await ctx.send("_No confidants found. Seek out allies to forge unbreakable bonds._")
             return None
 
-        max_name_length = max(
-            len(ctx.guild.get_member(int(confidant_id)).display_name) for confidant_id in user_data["scores"]
-        )
+        # Resolve each confidant's display name once; both the width pass and the row loop read from this
+        confidant_names = {}
+        for confidant_id in user_data["scores"]:
+            member = ctx.guild.get_member(int(confidant_id))
+            confidant_names[confidant_id] = member.display_name if member else "Unknown"
+        max_name_length = max(len(name) for name in confidant_names.values())
         max_level = await self.config.max_levels()  # Get max level from config
 
-        message = "# <a:hearty2k:1208204286962565161> Confidants \n\n"
+        # Collect the rows and join once instead of growing the message string per confidant
+        lines = ["# <a:hearty2k:1208204286962565161> Confidants \n"]
         for confidant_id, score in user_data["scores"].items():
             # Should we be putting levels in the config too?
             level = await self.level_manager.calculate_level(score)
             level_display = "<a:ui_sparkle:1241181537190547547> 𝙈𝘼𝙓" if level == max_level else f" ★ {level}"
             emoji = await get_user_emoji(discord.Object(id=confidant_id), self.config, ctx)
-            member = ctx.guild.get_member(int(confidant_id))
-            name = member.display_name if member else "Unknown"
+            name = confidant_names[confidant_id]
 
             # Pad the name to align the ranks
             emoji_str = f"<{'a' if emoji.animated else ''}:{emoji.name}:{emoji.id}>" if emoji else ""
@@ -89,7 +92,7 @@ class ConfidantsManager:
             mention = f"<@{confidant_id}>"
             padded_mention = f"{mention}{padding}"
 
-            message += f"### {emoji_str}⠀{padded_mention}{level_display}\n"
+            lines.append(f"### {emoji_str}⠀{padded_mention}{level_display}")
 
-        message += f"\nRank: {user_data.get('aggregate_score', 0)} pts\nType `/rank` for more"
-        return message
+        lines.append(f"\nRank: {user_data.get('aggregate_score', 0)} pts\nType `/rank` for more")
+        return "\n".join(lines)
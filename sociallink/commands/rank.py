@@ -112,10 +112,10 @@ class RankManager:
             return f"{rank}. {self._format_user_mention(user_id, runner_id)} **{score}pts**\n"
 
         if len(tie_group) >= 3:
-            user_mentions = ", ".join([self._format_user_mention(user_id, runner_id) for user_id, _ in tie_group[:-1]])
+            user_mentions = ", ".join(self._format_user_mention(user_id, runner_id) for user_id, _ in tie_group[:-1])
             user_mentions += f", and {self._format_user_mention(tie_group[-1][0], runner_id)}"
         else:
-            user_mentions = " & ".join([self._format_user_mention(user_id, runner_id) for user_id, _ in tie_group])
+            user_mentions = " & ".join(self._format_user_mention(user_id, runner_id) for user_id, _ in tie_group)
 
         score = tie_group[0][1]
         return f"{rank}.{user_mentions} {score}pts — {random.choice(self.tie_messages)}\n"  # noqa: S311
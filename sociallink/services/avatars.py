@@ -2,6 +2,7 @@ import asyncio
 import logging
 from io import BytesIO
 
+import aiohttp
 import discord
 from PIL import Image
 from redbot.core import Config, commands
@@ -11,18 +12,10 @@ from utilities.discord_utils import fetch_user_avatar
 logger = logging.getLogger(__name__)
 
 
-async def upload_avatar_as_emoji(
-    guild: discord.Guild, user: discord.User, avatar_data: bytes, config: Config
-) -> int | None:
+async def get_allowed_emoji_roles(guild: discord.Guild, config: Config) -> list[discord.Role]:
     """
-    Uploads a user's avatar as a guild emoji.
+    Resolves the roles avatar emojis are restricted to.
     """
-    retry_attempts = 5
-    backoff_delay = 2
-    asset_exceeds_max_size = 50045
-    http_status_rate_limited = 429
-    max_size = 256  # Discord's maximum emoji size is 256x256 pixels
-
     allowed_role_ids = await config.get_raw("restrict_avatar_emojis_to_roles", default=None)
     allowed_roles = []
     if allowed_role_ids:
@@ -32,6 +25,29 @@ async def upload_avatar_as_emoji(
                 allowed_roles.append(role)
             else:
                 logger.warning(f"Role with ID {role_id} not found in the guild.")
+    return allowed_roles
+
+
+async def upload_avatar_as_emoji(
+    guild: discord.Guild,
+    user: discord.User,
+    avatar_data: bytes,
+    config: Config,
+    allowed_roles: list[discord.Role] | None = None,
+) -> int | None:
+    """
+    Uploads a user's avatar as a guild emoji.
+
+    Callers uploading many avatars can pass allowed_roles resolved once via get_allowed_emoji_roles.
+    """
+    retry_attempts = 5
+    backoff_delay = 2
+    asset_exceeds_max_size = 50045
+    http_status_rate_limited = 429
+    max_size = 256  # Discord's maximum emoji size is 256x256 pixels
+
+    if allowed_roles is None:
+        allowed_roles = await get_allowed_emoji_roles(guild, config)
 
     logger.info("Restricting avatar emojis to roles: %s", allowed_roles)
 
@@ -81,22 +97,25 @@ async def update_avatar_emojis(bot, config):
         raise ValueError(no_guild_msg)
     emoji_mapping = {}
     asset_exceeds_max_size = 50045
-    for member in guild.members:
-        try:
-            avatar_data = await fetch_user_avatar(member)
-            emoji_id = await upload_avatar_as_emoji(guild, member, avatar_data, config)
-            emoji_mapping[member.id] = emoji_id
-            await config.user(member).set_raw("emoji_id", value=emoji_id)
-        except discord.HTTPException as e:
-            if e.code == asset_exceeds_max_size:
-                logger.exception("Failed to upload avatar for %s", {member.display_name})
-                raise
-            else:
+    allowed_roles = await get_allowed_emoji_roles(guild, config)
+    # One session for the whole pass so avatar downloads reuse connections to the CDN
+    async with aiohttp.ClientSession() as session:
+        for member in guild.members:
+            try:
+                avatar_data = await fetch_user_avatar(member, session)
+                emoji_id = await upload_avatar_as_emoji(guild, member, avatar_data, config, allowed_roles)
+                emoji_mapping[member.id] = emoji_id
+                await config.user(member).set_raw("emoji_id", value=emoji_id)
+            except discord.HTTPException as e:
+                if e.code == asset_exceeds_max_size:
+                    logger.exception("Failed to upload avatar for %s", {member.display_name})
+                    raise
+                else:
+                    logger.exception("Failed to update avatar for %s", {member.display_name})
+                    raise
+            except Exception:
                 logger.exception("Failed to update avatar for %s", {member.display_name})
                 raise
-        except Exception:
-            logger.exception("Failed to update avatar for %s", {member.display_name})
-            raise
     return emoji_mapping
 
 
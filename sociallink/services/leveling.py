@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import random
 from datetime import UTC, datetime
+from operator import itemgetter
 
 import discord
 
@@ -75,9 +77,11 @@ class LevelManager(Observer):
             return random.choice(new_level_close)  # noqa: S311
 
     async def calculate_level(self, score):
-        base_s_link = await self.config.base_s_link()
-        level_exponent = await self.config.level_exponent()
-        max_levels = await self.config.max_levels()
+        # One read of the global settings instead of one per value; handle_link calls this several times per event
+        settings = await self.config.all()
+        base_s_link = settings["base_s_link"]
+        level_exponent = settings["level_exponent"]
+        max_levels = settings["max_levels"]
         level = 0
         # logger.debug("Calculating level for score: %d", score)
         while score > base_s_link + (level**level_exponent) and level < max_levels:
@@ -121,6 +125,19 @@ class LevelManager(Observer):
 
         return embed
 
+    async def _add_to_score(self, user, confidant_id: str, points) -> float:
+        """
+        Adds points to a user's score with a confidant and returns the new score.
+
+        Scores and aggregate_score are updated from a fresh read in a single Config write, so other
+        fields of the user's record changed meanwhile (journal, emoji_id, ...) are left untouched.
+        """
+        async with self.config.user(user).all() as user_data:
+            scores = user_data["scores"]
+            scores[confidant_id] = scores.get(confidant_id, 0) + points
+            user_data["aggregate_score"] = sum(scores.values())
+            return scores[confidant_id]
+
     async def handle_link(self, *args, **kwargs):
         try:
             ctx = kwargs.get("ctx")
@@ -132,26 +149,18 @@ class LevelManager(Observer):
             channel_id = kwargs.get("channel_id")
             score_increment = kwargs.get("points")
 
-            user1_id_str = str(user1.id)
-            user2_id_str = str(user2.id)
-            user1_data = await self.config.user(user1).all()
-            user2_data = await self.config.user(user2).all()
-
-            user1_data["scores"][user2_id_str] = user1_data["scores"].get(user2_id_str, 0) + score_increment
-            user2_data["scores"][user1_id_str] = user2_data["scores"].get(user1_id_str, 0) + score_increment
-
-            # Calculate and set aggregate_score for both users
-            user1_data["aggregate_score"] = sum(user1_data["scores"].values())
-            user2_data["aggregate_score"] = sum(user2_data["scores"].values())
+            # The two users' records are independent, so update them together
+            user1_score, user2_score = await asyncio.gather(
+                self._add_to_score(user1, str(user2.id), score_increment),
+                self._add_to_score(user2, str(user1.id), score_increment),
+            )
 
             # Calculate new levels
-            user1_new_level = await self.calculate_level(user1_data["scores"][user2_id_str])
-            user2_new_level = await self.calculate_level(user2_data["scores"][user1_id_str])
+            user1_new_level = await self.calculate_level(user1_score)
+            user2_new_level = await self.calculate_level(user2_score)
 
             # Announce rank increase if applicable
-            new_level_up = user1_new_level > await self.calculate_level(
-                user1_data["scores"][user2_id_str] - score_increment
-            )
+            new_level_up = user1_new_level > await self.calculate_level(user1_score - score_increment)
             logger.debug("Level up calculation was %s", new_level_up)
 
             if new_level_up:
@@ -171,14 +180,9 @@ class LevelManager(Observer):
                 )
 
             # TODO: Suppress for now while we prototype
-            # if user2_new_level > await self.calculate_level(user2_data["scores"][user1_id_str] - score_increment):
+            # if user2_new_level > await self.calculate_level(user2_score - score_increment):
             #     await self.announce_rank_increase(user2, user1, user2_new_level)
 
-            await self.config.user(user1).set_raw("scores", value=user1_data["scores"])
-            await self.config.user(user1).set_raw("aggregate_score", value=user1_data["aggregate_score"])
-            await self.config.user(user2).set_raw("scores", value=user2_data["scores"])
-            await self.config.user(user2).set_raw("aggregate_score", value=user2_data["aggregate_score"])
-
         except KeyError:
             logger.exception("Key error accessing user data")
             return (False, "Key error accessing user data")
@@ -220,21 +224,16 @@ class LevelManager(Observer):
                 return
 
             # Fetch journal entries for both users
-            user_1_data = await config.user(user_1).all()
-            user_2_data = await config.user(user_2).all()
+            user_1_data, user_2_data = await asyncio.gather(config.user(user_1).all(), config.user(user_2).all())
 
-            # Get the latest journal entry for each user
+            # Get the latest journal entry for each user; max() is a single pass where sorting the journal was O(n log n)
             user_1_latest_journal = (
-                sorted(user_1_data.get("journal", []), key=lambda x: x["timestamp"], reverse=True)[0].get(
-                    "description", ""
-                )
+                max(user_1_data["journal"], key=itemgetter("timestamp")).get("description", "")
                 if user_1_data.get("journal")
                 else ""
             )
             user_2_latest_journal = (
-                sorted(user_2_data.get("journal", []), key=lambda x: x["timestamp"], reverse=True)[0].get(
-                    "description", ""
-                )
+                max(user_2_data["journal"], key=itemgetter("timestamp")).get("description", "")
                 if user_2_data.get("journal")
                 else ""
             )
@@ -1,4 +1,5 @@
 import logging
+import time
 
 import discord
 from redbot.core import commands
@@ -12,11 +13,25 @@ from utilities.image_utils import get_image_handler
 
 logger = logging.getLogger(__name__)
 
+# How long a guild's message_mention points stay cached before Config is read again
+MENTION_POINTS_TTL_SECONDS = 60.0
+
 
 class ListenerManager(commands.Cog):
     def __init__(self, config, event_bus):
         self.config = config
         self.event_bus = event_bus
+        self._mention_points: dict[int, tuple[float, int]] = {}
+
+    async def _get_mention_points(self, guild):
+        """Points awarded for a quote or mention, cached per guild so busy channels don't read Config per message."""
+        now = time.monotonic()
+        cached = self._mention_points.get(guild.id)
+        if cached is not None and now - cached[0] < MENTION_POINTS_TTL_SECONDS:
+            return cached[1]
+        points = await self.config.guild(guild).get_raw("message_mention", "points")
+        self._mention_points[guild.id] = (now, points)
+        return points
 
     async def on_message(self, message):
         """
@@ -35,6 +50,9 @@ class ListenerManager(commands.Cog):
                 channel_id,
             )
             await MetricsTracker.log_event("message_with_media_attachment", {"message_id": message.id})  # Log the event
+        # Links are scored per guild; DMs have no guild settings to read, so stop before any Config lookup
+        if message.guild is None:
+            return
         if message.reference is not None:
             # note that message.reference.resolved can be either a discord.Message or discord.DeletedReferencedMessage object.
             # If it's a discord.DeletedReferencedMessage object, the author attribute will not be available,
@@ -45,7 +63,7 @@ class ListenerManager(commands.Cog):
             if replied_to == message.author:
                 return
 
-            points = await self.config.guild(message.guild).get_raw("message_mention", "points")
+            points = await self._get_mention_points(message.guild)
 
             self.event_bus.fire(
                 Events.ON_MESSAGE_QUOTE,
@@ -65,12 +83,11 @@ class ListenerManager(commands.Cog):
             await MetricsTracker.log_event(
                 "message_quote", {"message_id": message.id, "replied_to_id": replied_to.id if replied_to else None}
             )  # Log the event
-        if message.mentions:
-            for member in message.mentions:
-                if member == message.author:
-                    continue
-                points = await self.config.guild(message.guild).get_raw("message_mention", "points")
-
+        # Self-mentions score nothing, so filter them before reading the points setting
+        confidants = [member for member in message.mentions if member != message.author]
+        if confidants:
+            points = await self._get_mention_points(message.guild)
+            for member in confidants:
                 self.event_bus.fire(
                     Events.ON_MESSAGE_MENTION,
                     message=message,
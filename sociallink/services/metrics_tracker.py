@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections import defaultdict
 from datetime import UTC, datetime
@@ -14,9 +15,13 @@ metrics_directory = current_directory / "metrics"
 logger.info(f"Metrics directory: {metrics_directory}")
 metrics_directory.mkdir(parents=True, exist_ok=True)
 
+# Events logged within this window are written to the CSV together, off the listener's await path
+METRICS_FLUSH_DELAY_SECONDS = 5.0
+
 
 class MetricsTracker:
     metrics: ClassVar[defaultdict] = defaultdict(list)
+    _flush_task: ClassVar[asyncio.Task | None] = None
 
     def __init__(self, bot, config, event_bus):
         self.bot = bot
@@ -44,21 +49,39 @@ class MetricsTracker:
 
         cls.metrics[event_type].append(log_entry)
         logging.info("%s: %s", event_type, details)
-        event_count_before_save = 2
-        if sum(len(events) for events in cls.metrics.values()) >= event_count_before_save:
-            await cls.save_metrics()
+        if cls._flush_task is None or cls._flush_task.done():
+            cls._flush_task = asyncio.create_task(cls._flush_later())
+
+    @classmethod
+    async def _flush_later(cls):
+        await asyncio.sleep(METRICS_FLUSH_DELAY_SECONDS)
+        await cls.save_metrics()
+
+    @classmethod
+    async def flush(cls):
+        """Write buffered events now instead of waiting for the delayed flush, e.g. when the cog unloads."""
+        if cls._flush_task is not None:
+            cls._flush_task.cancel()
+            cls._flush_task = None
+        await cls.save_metrics()
 
     @classmethod
     async def save_metrics(cls):
+        # Swap the buffer out first so events logged while the file is written land in the next batch
+        batch, cls.metrics = cls.metrics, defaultdict(list)
+        if not batch:
+            return
         try:
-            metric_df = pd.DataFrame(cls.metrics)
-            csv_path = metrics_directory / "metrics.csv"
-            metric_df.to_csv(csv_path, mode="a", header=not csv_path.exists(), index=False)
-            cls.metrics.clear()  # Clear the list once saved.
-
+            await asyncio.to_thread(cls._write_csv, batch)
         except Exception:
             logger.exception("Error saving metrics to CSV:")
 
+    @staticmethod
+    def _write_csv(batch):
+        metric_df = pd.DataFrame(batch)
+        csv_path = metrics_directory / "metrics.csv"
+        metric_df.to_csv(csv_path, mode="a", header=not csv_path.exists(), index=False)
+
     def generate_report(self):
         pass
 
@@ -21,7 +21,6 @@ from .services.slinks import SLinkManager
 
 load_dotenv()
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 # TODO: Update this to properly load from the .env file
@@ -122,6 +121,10 @@ class SocialLink(commands.Cog):
         self.config.register_guild(**default_roles)
         self.voice_sessions = {}
 
+    async def cog_unload(self):
+        # Don't lose events still waiting on the delayed metrics flush
+        await self.metrics_tracker.flush()
+
     @commands.Cog.listener()
     async def on_ready(self):
         guild_id = GUILD_ID  # Assuming GUILD_ID is the ID of your guild
@@ -130,19 +133,17 @@ class SocialLink(commands.Cog):
             logger.error(f"Guild with ID {guild_id} not found.")
             return
 
-        members = guild.members  # This gets all members of the guild
+        # Scores are keyed by string member ID; convert each human member's ID once rather than per pair
+        member_ids = [str(member.id) for member in guild.members if not member.bot]  # Skip bots
         all_users = await self.config.all_users()  # Await the coroutine directly
-        for member in members:
-            if member.bot:  # Skip bot accounts to avoid unnecessary data storage
-                continue
-            user_scores = all_users.get(str(member.id), {}).get("scores", {})
-            for other_member in members:
-                if other_member.id == member.id or other_member.bot:  # Skip self and bots
+        for member_id in member_ids:
+            user_scores = all_users.get(member_id, {}).get("scores", {})
+            for other_member_id in member_ids:
+                if other_member_id == member_id:  # Skip self
                     continue
                 # Initialize score if not exist
-                if str(other_member.id) not in user_scores:
-                    user_scores[str(other_member.id)] = 0
-            all_users[str(member.id)] = {
+                user_scores.setdefault(other_member_id, 0)
+            all_users[member_id] = {
                 "scores": user_scores,
                 "aggregate_score": 0,
                 "journal": [],
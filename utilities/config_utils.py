@@ -1,14 +1,17 @@
-import inspect
+import functools
 import json
 import os
+from pathlib import Path
+from types import MappingProxyType
 
 
-def load_cogs_info_json(file_name: str) -> dict:
+def load_cogs_info_json(module_file: str | Path, file_name: str) -> dict:
     """
     Load configuration data from a JSON file located in the directory of the calling cog.
 
     Args:
     ----
+        module_file (str | Path): The calling module's __file__.
         file_name (str): The name of the JSON file.
 
     Returns:
@@ -16,14 +19,83 @@ def load_cogs_info_json(file_name: str) -> dict:
         dict: The loaded configuration data.
 
     """
-    # Get the frame of the caller
-    caller_frame = inspect.stack()[1]
-    # Get the module object of the caller
-    caller_module = inspect.getmodule(caller_frame[0])
     # Get the directory of the caller module
-    caller_dir = os.path.dirname(os.path.abspath(caller_module.__file__))
+    caller_dir = os.path.dirname(os.path.abspath(module_file))
     # Construct the full path to the JSON file
     config_path = os.path.join(caller_dir, file_name)
 
     with open(config_path) as f:
         return json.load(f)
+
+
+def lazy_end_user_data_statement(module_file: str):
+    """
+    Build a cog package's module-level __getattr__ that reads its end user data statement lazily.
+
+    info.json is only opened the first time Red asks for __red_end_user_data_statement__, not at import time.
+
+    Args:
+    ----
+        module_file (str): The cog package's __file__.
+
+    Returns:
+    -------
+        Callable[[str], str]: The __getattr__ to assign in the package's __init__.
+
+    """
+    package_dir = Path(module_file).parent
+
+    @functools.cache
+    def end_user_data_statement() -> str:
+        with (package_dir / "info.json").open(encoding="utf-8") as fp:
+            return json.load(fp)["end_user_data_statement"]
+
+    def __getattr__(name: str) -> str:  # noqa: N807
+        if name == "__red_end_user_data_statement__":
+            return end_user_data_statement()
+        raise AttributeError(f"module {package_dir.name!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+# mtime_ns is only part of the cache key, so an edited file is parsed again
+@functools.lru_cache(maxsize=32)
+def _load_json(path_str: str, mtime_ns: int) -> MappingProxyType:  # noqa: ARG001
+    with open(path_str, encoding="utf-8") as f:
+        return MappingProxyType(json.load(f))
+
+
+def load_cog_strings(cog_dir: Path) -> MappingProxyType:
+    """
+    Load the localized strings.json that sits in a cog's directory.
+
+    The parsed file is cached on its modification time; every caller shares the
+    same read-only mapping, and a reload re-parses it only if it was edited.
+
+    Args:
+    ----
+        cog_dir (Path): The directory containing the cog's strings.json.
+
+    Returns:
+    -------
+        MappingProxyType: The parsed strings.
+
+    """
+    strings_path = (cog_dir / "strings.json").resolve()
+    return _load_json(str(strings_path), strings_path.stat().st_mtime_ns)
+
+
+@functools.cache
+def guild_id_from_env() -> int:
+    """
+    Return the GUILD_ID environment variable as an int, read once per process.
+
+    Raises:
+    ------
+        OSError: If GUILD_ID is not set.
+
+    """
+    value = os.environ.get("GUILD_ID")
+    if value is None:
+        raise OSError("GUILD_ID is not set in the environment or .env file.")
+    return int(value)
@@ -1,7 +1,16 @@
+import functools
 from datetime import date, datetime
 
 from dateutil.relativedelta import relativedelta
 
+ISO_DATE_FORMAT = "%Y-%m-%d"
+MONTH_DAY_FORMAT = "%m-%d"
+
+
+@functools.lru_cache(maxsize=1024)
+def _strptime_date(date_string: str, format_str: str) -> date:
+    return datetime.strptime(date_string, format_str).date()
+
 
 class DateUtil:
 
@@ -22,6 +31,7 @@ class DateUtil:
             raise TypeError("input_date must be a datetime.datetime or datetime.date instance")
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_presentable_date(input_date: date) -> str:
         """Returns a date string in the format 'Mon, Sept 18, YYYY'"""
         return input_date.strftime("%a, %b %d, %Y")
@@ -39,7 +49,13 @@ class DateUtil:
     @staticmethod
     def str_to_date(date_string: str, format_str: str = "%a, %b %d, %Y") -> datetime.date:
         """Converts a date string to a date object using the specified format string"""
-        return datetime.strptime(date_string, format_str).date()
+        # The two numeric formats used for holidays and poll keys skip strptime's regex machinery
+        if format_str == ISO_DATE_FORMAT and len(date_string) == 10 and date_string[4] == date_string[7] == "-":
+            return date.fromisoformat(date_string)
+        if format_str == MONTH_DAY_FORMAT and len(date_string) == 5 and date_string[2] == "-":
+            # strptime defaults the year to 1900 when the format has none
+            return date.fromisoformat(f"1900-{date_string}")
+        return _strptime_date(date_string, format_str)
 
     @staticmethod
     def sort_dates(dates: list[date]) -> list[date]:
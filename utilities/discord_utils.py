@@ -1,6 +1,8 @@
 import logging
+import math
 import os
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Sequence
 
 import aiofiles
 import aiohttp
@@ -16,6 +18,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_THREAD_NAME = "Hello World Thread"
 DEFAULT_THREAD_MESSAGE = "This is the first message in the thread."
 THREAD_CREATION_ERROR = "An error occurred while creating the thread."
+SERVER_OWNER_TTL_SECONDS = 10.0
+
+# user_id -> (checked_at, is_owner); short-lived so repeated checks in a burst skip the user lookup
+_server_owner_cache: dict[int, tuple[float, bool]] = {}
 
 
 async def is_server_owner(bot, user_id: int) -> bool:
@@ -32,11 +38,24 @@ async def is_server_owner(bot, user_id: int) -> bool:
         True if the user is a server owner, False otherwise.
 
     """
-    user = await bot.fetch_user(user_id)
-    if user.bot:
-        return False
-
-    return any(guild.owner_id == user_id for guild in bot.guilds)
+    now = time.monotonic()
+    cached = _server_owner_cache.get(user_id)
+    if cached is not None and now - cached[0] < SERVER_OWNER_TTL_SECONDS:
+        return cached[1]
+
+    # Prefer the gateway's user cache; only hit the API for users the bot hasn't seen
+    user = bot.get_user(user_id) or await bot.fetch_user(user_id)
+    result = not user.bot and any(guild.owner_id == user_id for guild in bot.guilds)
+    # Drop expired entries on write, so the cache only ever holds users checked within the last TTL
+    expired_ids = [
+        cached_id
+        for cached_id, (checked_at, _) in _server_owner_cache.items()
+        if now - checked_at >= SERVER_OWNER_TTL_SECONDS
+    ]
+    for cached_id in expired_ids:
+        del _server_owner_cache[cached_id]
+    _server_owner_cache[user_id] = (now, result)
+    return result
 
 
 async def create_discord_thread(
@@ -280,13 +299,19 @@ async def restore_guild_banner(guild, file_path, *, delete_after_restore=False):
         raise
 
 
-async def fetch_user_avatar(user):
+async def fetch_user_avatar(user, session: aiohttp.ClientSession | None = None):
     """
     Fetches the avatar for a user.
+
+    Pass a session when fetching many avatars in a row so they share one connection pool.
     """
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await fetch_user_avatar(user, own_session)
+
     http_ok = 200
     avatar_url = user.display_avatar.url
-    async with aiohttp.ClientSession() as session, session.get(avatar_url) as response:
+    async with session.get(avatar_url) as response:
         if response.status == http_ok:
             return await response.read()
 
@@ -380,3 +405,32 @@ class PaginatorView(View):
         # remove buttons on timeout
         message = await self.interaction.original_response()
         await message.edit(view=None)
+
+
+class LazyPages(Sequence):
+    """Pages cut from a list of items and formatted only when first read, for use as PaginatorView's pages."""
+
+    def __init__(self, items: Sequence, formatter: Callable[[Sequence], str], page_size: int = 10):
+        self.items = items
+        self.formatter = formatter
+        self.page_size = page_size
+        self._formatted: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return math.ceil(len(self.items) / self.page_size)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        page = self._formatted.get(index)
+        if page is None:
+            start = index * self.page_size
+            page = self._formatted[index] = self.formatter(self.items[start : start + self.page_size])
+        return page
+
+
+class LazyPaginatorView(PaginatorView):
+    def __init__(self, items: Sequence, formatter: Callable[[Sequence], str], page_size: int = 10, timeout=180):
+        super().__init__(LazyPages(items, formatter, page_size), timeout=timeout)
@@ -1,9 +1,12 @@
+import functools
 import logging
 
 import wcwidth
 
 logger = logging.getLogger(__name__)
 
+# get_max_widths and format_row both measure every cell, so the second pass is served from here
+@functools.lru_cache(maxsize=1024)
 def calculate_display_width(text):
     return sum(wcwidth.wcwidth(char) for char in text)
 
@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import json
 import logging
@@ -5,36 +6,54 @@ import os
 
 from redbot.core import Config
 
+from utilities.config_utils import guild_id_from_env
+
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _identifier_for(cog_name: str) -> int:
+    """Config identifier derived from the cog's class name, computed once per name."""
+    # Same value as int(hexdigest, 16) % 10**10, so existing Config data stays reachable.
+    return int.from_bytes(hashlib.sha256(cog_name.encode()).digest(), "big") % 10**10
+
+
+def _parse_coords(coord_str: str) -> tuple[float, float]:
+    """Split a stored "lat,lon" string into floats."""
+    lat, _, lon = coord_str.partition(",")
+    return float(lat), float(lon)
+
+
 class ConfigManager:
     def __init__(self, guild_id, cog_instance):
-        cog_name = cog_instance.__class__.__name__
-        identifier = int(hashlib.sha256(cog_name.encode()).hexdigest(), 16) % 10**10
-        get_guild_id_from_env = int(os.getenv("GUILD_ID", None))
-        set_guild_id = guild_id or get_guild_id_from_env
-        if set_guild_id is None:
-            error_no_guild_id = "No GUILD_ID passed or set from .env file."
-            raise ValueError(error_no_guild_id)
+        identifier = _identifier_for(cog_instance.__class__.__name__)
+        guild_id = guild_id or guild_id_from_env()
 
         self.config = Config.get_conf(cog_instance, identifier=identifier, force_registration=True)
         logger.info("Config: %s", self.config)
         default_locations = json.loads(os.getenv("WX_LOCATIONS", "{}"))
         default_guild = {"guild_id": guild_id, "default_locations": default_locations, "weather_channel_id": None}
         self.config.register_guild(**default_guild)
+        # Each guild's settings, loaded with one Config read and dropped whenever a setter writes
+        self._guild_cache: dict[int, dict] = {}
+
+    async def _get_guild_state(self, guild_id: int) -> dict:
+        state = self._guild_cache.get(guild_id)
+        if state is None:
+            state = self._guild_cache[guild_id] = await self.config.guild_from_id(guild_id).all()
+        return state
 
     async def set_default_location(self, guild_id: int, location: str):
         await self.config.guild_from_id(guild_id).default_location.set(location)
+        self._guild_cache.pop(guild_id, None)
 
     async def get_default_locations(self, guild_id: int):
-        locations = await self.config.guild_from_id(guild_id).default_locations()
-        for city, (api_type, coord_str) in locations.items():
-            locations[city] = (api_type, tuple(map(float, coord_str.split(","))))
-        return locations
+        locations = (await self._get_guild_state(guild_id))["default_locations"]
+        return {city: (api_type, _parse_coords(coord_str)) for city, (api_type, coord_str) in locations.items()}
 
     async def set_weather_channel(self, guild_id: int, channel_id: int):
         await self.config.guild_from_id(guild_id).weather_channel_id.set(channel_id)
+        self._guild_cache.pop(guild_id, None)
 
     async def get_weather_channel(self, guild_id: int):
-        return await self.config.guild_from_id(guild_id).weather_channel_id()
+        return (await self._get_guild_state(guild_id))["weather_channel_id"]
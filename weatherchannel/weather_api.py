@@ -1,21 +1,62 @@
+import asyncio
 import logging
+import random
 from abc import ABC, abstractmethod
 
 import aiohttp
 
 logger = logging.getLogger(__name__)
 
+MAX_ATTEMPTS = 4
+BASE_BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 8.0
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 
 class WeatherAPIHandler(ABC):
     def __init__(self):
-        self.session = aiohttp.ClientSession()
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared session, created lazily so keep-alive connections are reused across requests."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300))
+        return self._session
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.session.close()
+        await self.close()
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _get_json(self, url: str, params: dict | None = None):
+        """
+        GET a JSON document, retrying transient failures with exponential backoff and jitter.
+
+        Client errors other than 429 are not retried since repeating the request cannot fix them.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                async with self.session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRYABLE_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                reason = e.status
+            except (aiohttp.ClientConnectionError, TimeoutError) as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                reason = type(e).__name__
+            delay = min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * 2**attempt) + random.uniform(0, 0.1)  # noqa: S311
+            logger.warning("Request to %s failed (%s), retrying in %.2fs", url, reason, delay)
+            await asyncio.sleep(delay)
+        return None
 
     @abstractmethod
     async def get_forecast(self, location: str):
@@ -35,18 +76,16 @@ class OpenMeteoAPI(WeatherAPIHandler):
     BASE_URL = "https://api.open-meteo.com/v1/forecast"
 
     async def get_forecast(self, location: str):
+        latitude, _, longitude = location.partition(",")
         params = {
-            "latitude": location.split(",")[0],
-            "longitude": location.split(",")[1],
+            "latitude": latitude,
+            "longitude": longitude,
             "hourly": "temperature_2m,relative_humidity_2m,wind_speed_10m",
             "daily": "temperature_2m_max,temperature_2m_min,sunrise,sunset",
             "timezone": "auto",
         }
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.BASE_URL, params=params) as response:
-                    response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-                    return await response.json()
+            return await self._get_json(self.BASE_URL, params=params)
         except aiohttp.ClientError as e:
             self._reraise_exception(e, "Error fetching forecast from Open-Meteo API", location)
 
@@ -61,24 +100,22 @@ class WeatherGovAPI(WeatherAPIHandler):
     BASE_URL = "https://api.weather.gov"
 
     def _validate_location_format(self, location: str):
-        location = "".join(char for char in location if char.isdigit() or char == "," or char == "." or char == "-")
-        parts = location.split(",")
-        if len(parts) != 2:
+        lat, sep, lon = location.partition(",")
+        if not sep or "," in lon:
             lat_long_error = f"Location format error: Expected 'lat,lon', got '{location}'"
             raise ValueError(lat_long_error)
-        return map(float, parts)  # returns a tuple of (lat, lon)
+        # float() tolerates surrounding whitespace and rejects anything else, so no character filtering is needed
+        return float(lat), float(lon)
 
     async def _get_gridpoint(self, location: str):
         """Helper function to get gridpoint for a location."""
         try:
             lat, lon = self._validate_location_format(location)
             endpoint = f"/points/{lat},{lon}"
-            async with self.session.get(self.BASE_URL + endpoint) as response:
-                response.raise_for_status()
-                data = await response.json()
-                forecast_url = data["properties"]["forecast"]
-                logger.debug("Forecast URL retrieved: %s", forecast_url)
-                return forecast_url
+            data = await self._get_json(self.BASE_URL + endpoint)
+            forecast_url = data["properties"]["forecast"]
+            logger.debug("Forecast URL retrieved: %s", forecast_url)
+            return forecast_url
         except ValueError as e:  # Catch specific ValueError
             self._reraise_exception(e, "Invalid location string", location)
         except aiohttp.ClientError as e:  # Catch specific aiohttp ClientError
@@ -93,13 +130,11 @@ class WeatherGovAPI(WeatherAPIHandler):
         """Retrieve forecast data for a given location."""
         try:
             forecast_url = await self._get_gridpoint(location)
-            async with self.session.get(forecast_url) as response:
-                response.raise_for_status()
-                forecast_data = await response.json()
-                if "properties" not in forecast_data:
-                    logger.error("Forecast data missing 'properties' key: %s", forecast_data)
-                    raise KeyError("Forecast data missing 'properties' key")
-                return forecast_data
+            forecast_data = await self._get_json(forecast_url)
+            if "properties" not in forecast_data:
+                logger.error("Forecast data missing 'properties' key: %s", forecast_data)
+                raise KeyError("Forecast data missing 'properties' key")
+            return forecast_data
         except aiohttp.ClientError as e:  # Catch specific aiohttp ClientError
             self._reraise_exception(e, "Error retrieving forecast data", location)
         except KeyError as e: # Catch specific KeyError if 'properties' is missing in forecast data
@@ -112,19 +147,13 @@ class WeatherGovAPI(WeatherAPIHandler):
         """Retrieve alerts for a given location."""
         try:
             forecast_url = await self._get_gridpoint(location)
-            async with self.session.get(forecast_url) as response:
-                response.raise_for_status()
-                return await response.json()
+            return await self._get_json(forecast_url)
         except aiohttp.ClientError as e:  # Catch specific aiohttp ClientError
             self._reraise_exception(e, "Error retrieving alerts data", location)
         except Exception as e:  # Catch any other unexpected exceptions
             self._reraise_exception(e, "Error retrieving alerts data", location)
 
 
-    async def close(self):
-        await self.session.close()
-
-
 class WeatherAPIFactory:
     @staticmethod
     def create_weather_api_handler(api_type: str) -> WeatherAPIHandler:
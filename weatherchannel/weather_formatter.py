@@ -1,10 +1,20 @@
 import logging
+import sys
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from typing import ClassVar
 
 logger = logging.getLogger(__name__)
 
+# Column keys of a formatted forecast row. Non-ASCII literals are not interned automatically, so intern them once
+# and share these objects between the formatter and the cog's table layout.
+CITY_KEY = sys.intern("ᴄɪᴛʏ")
+CONDITION_KEY = sys.intern("ᴄᴏɴᴅ")
+HIGH_KEY = sys.intern("ʜ°ᴄ")
+LOW_KEY = sys.intern("ʟ°ᴄ")
+PRECIP_KEY = sys.intern("ᴘʀᴇᴄɪᴘ")
+
+
 class CityCodes:
     codes: ClassVar[dict[str, str]] = {
         "Austin": "AUS",
@@ -40,6 +50,8 @@ class CityCodes:
 
 
 class WeatherFormatterInterface(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def format_individual_forecast(self, weather_data, city_name=None):
         pass
@@ -50,6 +62,8 @@ class WeatherFormatterInterface(ABC):
 
 
 class OpenMeteoFormatter(WeatherFormatterInterface):
+    __slots__ = ()
+
     def format_individual_forecast(self, weather_data, city_name=None):
         temperature = weather_data["hourly"]["temperature_2m"][0]
         condition = "Sunny"  # Map weather codes to conditions
@@ -64,49 +78,51 @@ class OpenMeteoFormatter(WeatherFormatterInterface):
 
 
 class WeatherGovFormatter(WeatherFormatterInterface):
-    def __init__(self):
-        self.icon_map = {
-            "Sunny": "☀",
-            "Clear": "◯",
-            "Mostly Sunny": "☼",
-            "Partly Sunny": "◔",
-            "Mostly Cloudy": "☁",
-            "Cloudy": "●",
-            "Rain Showers": "☂",
-            "Chance Rain Showers": "☂",
-            "Slight Chance Rain Showers": "☂",
-            "Thunderstorms": "☇",
-            "Chance Thunderstorms": "☇",
-            "Slight Chance Thunderstorms": "☇",
-            "Snow": "❄",
-            "Chance Snow": "❄",
-            "Slight Chance Snow": "❄",
-            "Fog": "🌫",  # This is a two-character Unicode symbol for fog
-            "Haze": "☈",
-            "Windy": "💨",
-            "Hot": "♨",
-            "Cold": "❆",
-            "Partly Cloudy": "◒",  # Similar to partly sunny but emphasizes clouds
-            "Light Rain": "☂",
-            "Heavy Rain": "☔",
-            "Light Snow": "❄",
-            "Heavy Snow": "☃",
-            "Freezing Rain": "❆",  # Represents freezing conditions
-            "Sleet": "❆",
-            "Flurries": "❄",
-            "Scattered Showers": "☔",
-            "Isolated Showers": "☔",
-            "Scattered Thunderstorms": "☇",
-            "Isolated Thunderstorms": "☇",
-            # Additional or less common conditions:
-            "Breezy": "💨",
-            "Blustery": "💨",
-            "Wintry Mix": "❆",
-            "Dust": "💨",  # Represents blowing dust
-            "Smoke": "🌫",
-            "Frigid": "❆",
-            "Warm": "♨",
-        }
+    __slots__ = ()
+
+    # Class-level so each formatter instance doesn't build its own copy
+    icon_map: ClassVar[dict[str, str]] = {
+        "Sunny": "☀",
+        "Clear": "◯",
+        "Mostly Sunny": "☼",
+        "Partly Sunny": "◔",
+        "Mostly Cloudy": "☁",
+        "Cloudy": "●",
+        "Rain Showers": "☂",
+        "Chance Rain Showers": "☂",
+        "Slight Chance Rain Showers": "☂",
+        "Thunderstorms": "☇",
+        "Chance Thunderstorms": "☇",
+        "Slight Chance Thunderstorms": "☇",
+        "Snow": "❄",
+        "Chance Snow": "❄",
+        "Slight Chance Snow": "❄",
+        "Fog": "🌫",  # This is a two-character Unicode symbol for fog
+        "Haze": "☈",
+        "Windy": "💨",
+        "Hot": "♨",
+        "Cold": "❆",
+        "Partly Cloudy": "◒",  # Similar to partly sunny but emphasizes clouds
+        "Light Rain": "☂",
+        "Heavy Rain": "☔",
+        "Light Snow": "❄",
+        "Heavy Snow": "☃",
+        "Freezing Rain": "❆",  # Represents freezing conditions
+        "Sleet": "❆",
+        "Flurries": "❄",
+        "Scattered Showers": "☔",
+        "Isolated Showers": "☔",
+        "Scattered Thunderstorms": "☇",
+        "Isolated Thunderstorms": "☇",
+        # Additional or less common conditions:
+        "Breezy": "💨",
+        "Blustery": "💨",
+        "Wintry Mix": "❆",
+        "Dust": "💨",  # Represents blowing dust
+        "Smoke": "🌫",
+        "Frigid": "❆",
+        "Warm": "♨",
+    }
 
     def format_individual_forecast(self, weather_data, city_name=None):
         if not weather_data:
@@ -130,7 +146,8 @@ class WeatherGovFormatter(WeatherFormatterInterface):
             daytime_period = None
             nighttime_period = None
             for period in periods:
-                if current_date in period["startTime"]:
+                # startTime is ISO 8601, so the date is always its prefix; no need to scan the whole string
+                if period["startTime"].startswith(current_date):
                     if period["isDaytime"]:
                         daytime_period = period
                     else:
@@ -160,11 +177,11 @@ class WeatherGovFormatter(WeatherFormatterInterface):
             return "Error processing weather data."
         else:
             return {
-                    "ᴄɪᴛʏ": f"{city_code}  ",
-                    "ᴄᴏɴᴅ": f"{short_forecast}  ",
-                    "ʜ°ᴄ": f"{temperature_c_high}°  ",
-                    "ʟ°ᴄ": f"{temperature_c_low}°  ",
-                    "ᴘʀᴇᴄɪᴘ": f"{precipitation}",
+                    CITY_KEY: f"{city_code}  ",
+                    CONDITION_KEY: f"{short_forecast}  ",
+                    HIGH_KEY: f"{temperature_c_high}°  ",
+                    LOW_KEY: f"{temperature_c_low}°  ",
+                    PRECIP_KEY: f"{precipitation}",
                 }
 
     def format_alerts(self, alerts):
@@ -173,6 +190,8 @@ class WeatherGovFormatter(WeatherFormatterInterface):
 
 
 class WeatherFormatter:
+    __slots__ = ("formatter",)
+
     def __init__(self, formatter: WeatherFormatterInterface):
         self.formatter = formatter
 
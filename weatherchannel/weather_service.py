@@ -1,6 +1,5 @@
 import asyncio
 import logging
-from typing import Dict, Any
 
 from .weather_api import WeatherAPIFactory
 from .weather_formatter import (
@@ -16,8 +15,8 @@ class WeatherService:
     def __init__(self, strings):
         self.api_handlers = {}
         self.strings = strings
-        # Remove the service-level formatter initialization
-        # We'll create formatters per API type as needed
+        # Formatters are stateless, so one per API type serves every city in a forecast run
+        self.formatters: dict[str, WeatherFormatter] = {}
 
     def _create_formatter(self, api_type: str) -> WeatherFormatter:
         """Create appropriate formatter based on API type."""
@@ -31,14 +30,21 @@ class WeatherService:
             raise ValueError(error_msg)
         return WeatherFormatter(formatter=formatter)
 
+    async def close(self):
+        """Close the HTTP sessions held by the API handlers."""
+        for handler in self.api_handlers.values():
+            await handler.close()
+        self.api_handlers.clear()
+
     async def fetch_weather(self, api_type: str, coords, city: str):
         """Fetch and format weather data for given coordinates."""
         if api_type not in self.api_handlers:
             self.api_handlers[api_type] = WeatherAPIFactory.create_weather_api_handler(api_type)
 
         try:
-            # Create formatter for this API type
-            weather_formatter = self._create_formatter(api_type)
+            weather_formatter = self.formatters.get(api_type)
+            if weather_formatter is None:
+                weather_formatter = self.formatters[api_type] = self._create_formatter(api_type)
 
             # Validate coordinates
             if not isinstance(coords, tuple) or len(coords) != 2:
@@ -51,7 +57,8 @@ class WeatherService:
 
             # Convert coordinates to string format
             try:
-                coords_str = ",".join(map(str, map(float, coords)))
+                lat, lon = coords
+                coords_str = f"{float(lat)},{float(lon)}"
             except ValueError:
                 logger.exception("Error converting coordinates to float for %s:", city)
                 return {
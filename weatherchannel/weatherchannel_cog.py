@@ -1,9 +1,8 @@
 import asyncio
-import json  # Import json
 import logging
-import os
-from datetime import UTC, datetime, timedelta
-from pathlib import Path  # Import Path
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
 
 import discord
 import pytz
@@ -11,9 +10,11 @@ from discord import app_commands
 from discord.ext import tasks
 from redbot.core import commands
 
+from utilities.config_utils import guild_id_from_env, load_cog_strings
 from utilities.text_formatting_utils import format_row, get_max_widths
 
 from .config import ConfigManager
+from .weather_formatter import CITY_KEY, CONDITION_KEY, HIGH_KEY, LOW_KEY, PRECIP_KEY
 from .weather_service import WeatherService
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ class WeatherChannel(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.guild_id = int(os.getenv("GUILD_ID"))
+        self.guild_id = guild_id_from_env()
         self.strings = self.load_strings()  # Load strings first so WeatherService can use them
         self.weather_service = WeatherService(self.strings)  # Pass strings to WeatherService
         self.config_manager = ConfigManager(self.guild_id, self)
@@ -33,21 +34,20 @@ class WeatherChannel(commands.Cog):
         self.on_forecast_task_complete.start()
 
 
-    def load_strings(self) -> dict:  # Renamed for clarity, and to be called only once.
+    def load_strings(self) -> MappingProxyType:  # Renamed for clarity, and to be called only once.
         """Load localized strings from JSON file."""
-        path = Path(__file__).parent / "strings.json"
-        with path.open(encoding="utf-8") as f:
-            return json.load(f)
+        return load_cog_strings(Path(__file__).parent)
 
     @tasks.loop()
     async def on_forecast_task_complete(self):
         """Schedule the next run at 6 AM Eastern."""
         eastern = pytz.timezone("America/New_York")
         now_utc = datetime.now(pytz.utc)
+        now_eastern = now_utc.astimezone(eastern)
 
         # Calculate next 6 AM Eastern (or next day if past 6 AM already)
         next_eastern_6am = (
-            now_utc.astimezone(eastern)
+            now_eastern
             .replace(hour=8, minute=0, second=0, microsecond=0)  # 8 AM UTC is 6 AM Eastern
             .astimezone(pytz.utc)
         )
@@ -61,7 +61,7 @@ class WeatherChannel(commands.Cog):
         )
 
         # Sleep until scheduled time
-        delay = (next_eastern_6am - now_utc.astimezone(eastern)).total_seconds()
+        delay = (next_eastern_6am - now_eastern).total_seconds()
         await asyncio.sleep(delay)
 
         # Perform the forecast update task
@@ -71,9 +71,9 @@ class WeatherChannel(commands.Cog):
         self.on_forecast_task_complete.restart()
 
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.on_forecast_task_complete.cancel()
-        self.forecast_task.cancel()
+        await self.weather_service.close()
 
 
     weather = app_commands.Group(name="weather", description="Commands related to weather information")
@@ -112,7 +112,7 @@ class WeatherChannel(commands.Cog):
                   for city, (api_type, coords) in default_locations.items()]
             )
             forecasts = [f for f in forecasts if isinstance(f, dict) and "error" not in f]
-            keys = ["ᴄɪᴛʏ", "ʜ°ᴄ", "ʟ°ᴄ", "ᴘʀᴇᴄɪᴘ"]
+            keys = [CITY_KEY, HIGH_KEY, LOW_KEY, PRECIP_KEY]
         elif location in default_locations:
             # Fetch weather for the specified location
             api_type, coords = default_locations[location]
@@ -123,7 +123,7 @@ class WeatherChannel(commands.Cog):
                 )
                 return
             forecasts = [forecast_response]
-            keys = ["ᴄɪᴛʏ", "ᴄᴏɴᴅ", "ʜ°ᴄ", "ʟ°ᴄ", "ᴘʀᴇᴄɪᴘ"]
+            keys = [CITY_KEY, CONDITION_KEY, HIGH_KEY, LOW_KEY, PRECIP_KEY]
         else:
             await interaction.response.send_message(
                 self.strings["errors"]["location_not_recognized"], ephemeral=True
@@ -148,8 +148,6 @@ class WeatherChannel(commands.Cog):
         await interaction.response.send_message(f"`{table_string}`")
 
     async def forecast_task(self):
-        current_time = int(datetime.now(tz=UTC).timestamp())
-
         default_locations = await self.config_manager.get_default_locations(self.guild_id)
         if not default_locations:
             logger.warning("No default locations set for this guild.")
@@ -169,7 +167,7 @@ class WeatherChannel(commands.Cog):
                 logger.warning("No valid weather data to report in forecast task.")
                 return # Exit forecast task if no valid data
 
-            keys = ["ᴄɪᴛʏ", "ʜ°ᴄ", "ʟ°ᴄ", "ᴘʀᴇᴄɪᴘ"]
+            keys = [CITY_KEY, HIGH_KEY, LOW_KEY, PRECIP_KEY]
             alignments = ["left", "left", "left", "right"]
             widths = get_max_widths(table_data, keys)
 